@@ -3,6 +3,7 @@ import numpy as np
 from yagremcmc.model.interface import SolverInterface
 from yagremcmc.model.evaluation import EvaluationStatus
 from yagremcmc.parameter.vector import ParameterVector
+from yagremcmc.statistics.covariance import DiagonalCovarianceMatrix
 
 
 class ExampleLinearModelSolver(SolverInterface):
@@ -19,7 +20,24 @@ class ExampleLinearModelSolver(SolverInterface):
         self._b = b
 
         self._status = EvaluationStatus.NONE
-        self._evaluation = None
+
+        # evaluations are written into the same buffer on every invocation
+        self._evalBuffer = np.empty(b.shape)
+        self._evaluation = self._read_only_view()
+
+    def _read_only_view(self):
+
+        view = self._evalBuffer.view()
+        view.flags.writeable = False
+
+        return view
+
+    def __setstate__(self, state):
+
+        # pickling turns the view into an independent copy, e.g. when the
+        # solver is sent to a worker process
+        self.__dict__.update(state)
+        self._evaluation = self._read_only_view()
 
     @property
     def status(self):
@@ -43,7 +61,8 @@ class ExampleLinearModelSolver(SolverInterface):
 
         try:
 
-            self._evaluation = self._A @ self._paramCoordinates + self._b
+            np.dot(self._A, self._paramCoordinates, out=self._evalBuffer)
+            np.add(self._evalBuffer, self._b, out=self._evalBuffer)
             self._status = EvaluationStatus.SUCCESS
 
         except Exception as e:
@@ -52,20 +71,42 @@ class ExampleLinearModelSolver(SolverInterface):
             print("WARNING: Forward Model evaluation failed: " + str(e))
 
 
-def evaluate_posterior(mesh, likelihood, prior):
+def evaluate_posterior(xGrid, yGrid, likelihood, prior):
+    """
+    Normalised posterior density on the tensor grid spanned by xGrid and
+    yGrid. Rows of the result correspond to yGrid, as for np.meshgrid.
+    """
 
-    posterior = np.zeros(mesh.shape[:2])
+    mean = prior.mean.coefficient
+    cov = prior.covariance
 
-    for i in range(mesh.shape[0]):
-        for j in range(mesh.shape[1]):
-            theta = mesh[i, j]
-            thetaParam = ParameterVector(theta)
+    # a Gaussian prior with diagonal covariance is separable, such that only
+    # one-dimensional evaluations are required
+    if isinstance(cov, DiagonalCovarianceMatrix):
 
-            logPost = likelihood.evaluate_log(thetaParam) \
-                + prior.density.evaluate_log(thetaParam)
-            posterior[i, j] = np.exp(logPost)
+        margVar = cov.marginalVariance * np.ones(2)
 
-    # normalise
-    integral = np.sum(posterior)
+        logPrior = np.add.outer(-0.5 * (yGrid - mean[1])**2 / margVar[1],
+                                -0.5 * (xGrid - mean[0])**2 / margVar[0])
 
-    return posterior / integral
+    else:
+
+        X, Y = np.meshgrid(xGrid, yGrid)
+        points = np.stack((X.ravel(), Y.ravel()), axis=-1) - mean
+
+        logPrior = -0.5 * cov.induced_norm_squared(points).reshape(X.shape)
+
+    logPost = np.empty((yGrid.size, xGrid.size))
+
+    for i, y in enumerate(yGrid):
+        for j, x in enumerate(xGrid):
+            logPost[i, j] = likelihood.evaluate_log(
+                ParameterVector(np.array([x, y])))
+
+    logPost += logPrior
+
+    # shift before exponentiating to avoid underflow on large grids
+    posterior = np.exp(logPost - np.max(logPost))
+
+    # normalise
+    return posterior / np.sum(posterior)
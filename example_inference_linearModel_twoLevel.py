@@ -1,7 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-from numpy.random import seed, standard_normal
+from numpy.random import default_rng
 from exampleSetup import ExampleLinearModelSolver, evaluate_posterior
 from yagremcmc.parameter.vector import ParameterVector
 from yagremcmc.model.forwardModel import ForwardModel
@@ -14,14 +14,15 @@ from yagremcmc.statistics.likelihood import (AdditiveGaussianNoiseLikelihood,
 from yagremcmc.statistics.bayesModel import BayesianRegressionModel
 from yagremcmc.statistics.modelHierarchy import BayesianRegressionModelHierarchy
 from yagremcmc.utility.hierarchy import SharedComponent, Hierarchy
-from yagremcmc.chain.method.mrw import MRWBuilder
+from yagremcmc.chain.method.am import AdaptiveMRWBuilder
 from yagremcmc.chain.method.mlda import MLDABuilder
 from yagremcmc.chain.method.aem import AEMBuilder
 from yagremcmc.chain.diagnostics import FullDiagnostics
+from yagremcmc.chain.parallel import run_chains_parallel
 from yagremcmc.postprocessing.autocorrelation import integrated_autocorrelation
 
 
-seed(2222)
+rng = default_rng(2222)
 DIM = 2
 
 
@@ -39,8 +40,11 @@ surMap = tgtMap + surMapError
 surShift = np.array([0.5, -0.9])
 surSolver = ExampleLinearModelSolver(surMap, surShift)
 
-tgtFwdModel = ForwardModel(tgtSolver)
-surFwdModel = ForwardModel(surSolver)
+# MLDA revisits states across levels, so memoise the forward models over a
+# few subchains worth of evaluations
+fwdCacheSize = 20
+tgtFwdModel = ForwardModel(tgtSolver, fwdCacheSize)
+surFwdModel = ForwardModel(surSolver, fwdCacheSize)
 
 # generate data
 trueParam = ParameterVector(np.array([1.5, 0.5]))
@@ -50,9 +54,9 @@ nData = 5
 tgtSolver.interpolate(trueParam)
 tgtSolver.invoke()
 
-data = Data(np.array(
-    [tgtSolver.evaluation + dataNoiseStdDev * standard_normal(DIM)
-        for _ in range(nData)]))
+# draw all measurement errors at once and broadcast the model evaluation
+data = Data(np.asarray(tgtSolver.evaluation)[None, :]
+            + dataNoiseStdDev * rng.standard_normal((nData, DIM)))
 
 assert data.size == nData
 assert data.dim == DIM
@@ -131,31 +135,32 @@ proposalCov = IIDCovarianceMatrix(DIM, proposalMVar)
 # Target MRW
 # -------------
 
-tgtBuilder = MRWBuilder()
+# the single-level chains learn their proposal covariance during burn-in, the
+# fixed proposal only serves as initial covariance
+tgtBuilder = AdaptiveMRWBuilder()
 
-tgtBuilder.proposalCovariance = proposalCov
+tgtBuilder.initialCovariance = proposalCov
+tgtBuilder.collectionSteps = 500
+tgtBuilder.adaptionInterval = 20
 tgtBuilder.bayesModel = tgtModel
 
-print("\nrequest building target mrw")
-tgtMRW = tgtBuilder.build_method()
-
 # Surrogate MRW
 # -------------
 
-surBuilder = MRWBuilder()
-
-surBuilder.proposalCovariance = proposalCov
-surBuilder.bayesModel = surModel
-
-print("\nrequest building surrogate mrw")
-surMRW = surBuilder.build_method()
+surBuilder = AdaptiveMRWBuilder.from_prototype(tgtBuilder, bayesModel=surModel)
 
 
 # MLDA Burn-In Chain
 # ------------------
 
+# every MLDA chain draws from a random stream of its own. Generator.spawn
+# requires NumPy 1.25, so the streams are derived from a SeedSequence
+burninRng, vanillaRng, aemRng = [
+    default_rng(s) for s in np.random.SeedSequence(2225).spawn(3)]
+
 mldaBuilder = MLDABuilder()
 
+mldaBuilder.rng = burninRng
 mldaBuilder.baseProposalCovariance = proposalCov
 mldaBuilder.subChainLengths = [2]
 mldaBuilder.bayesModel = vanillaModel
@@ -167,11 +172,10 @@ mldaBurnin = mldaBuilder.build_method()
 # vanilla MLDA
 # ------------
 
-mldaBuilder = MLDABuilder()
-
-mldaBuilder.baseProposalCovariance = proposalCov
-mldaBuilder.subChainLengths = [5]
-mldaBuilder.bayesModel = vanillaModel
+# the remaining MLDA chains share the model and proposal covariance of the
+# burn-in chain, but get diagnostics of their own
+mldaBuilder = MLDABuilder.from_prototype(mldaBuilder, subChainLengths=[5],
+                                         rng=vanillaRng)
 
 print("\nrequest building vanilla mlda")
 vanillaMLDA = mldaBuilder.build_method()
@@ -180,295 +184,315 @@ vanillaMLDA = mldaBuilder.build_method()
 # adaptive error model MLDA
 # ------------------------------
 
-aemBuilder = AEMBuilder()
-
-aemBuilder.baseProposalCovariance = proposalCov
-aemBuilder.subChainLengths = [5]
-aemBuilder.bayesModel = aemModel
-aemBuilder.targetDiagnostics = FullDiagnostics()
+aemBuilder = AEMBuilder.from_prototype(mldaBuilder, bayesModel=aemModel,
+                                       targetDiagnostics=FullDiagnostics(),
+                                       rng=aemRng)
 
 print("\nrequest building aem mlda")
 aemMLDA = aemBuilder.build_method()
 
 
-# -----------------------------------------------------------------------------
-#                                INFERENCE
-# -----------------------------------------------------------------------------
+# the chains run in worker processes, which import this script. Only the
+# setup above may run on import
+if __name__ == "__main__":
 
-tgtNSteps = 50000
-tgtBurnin = 500
+    # -------------------------------------------------------------------------
+    #                                INFERENCE
+    # -------------------------------------------------------------------------
 
-initState = ParameterVector(np.zeros(DIM))
+    # the single-level MRW chains are independent of each other, so we split
+    # the total number of steps across several chains running in parallel
+    nChains = 4
 
-print(f"\nRunning {tgtNSteps} steps of the target MRW")
+    tgtNSteps = 50000 // nChains
+    tgtBurnin = 500
 
-tgtMRW.run(tgtNSteps, initState)
-tgtStates = tgtMRW.chain.trajectory
+    # posterior mean estimates of all four chains: target MRW, surrogate MRW,
+    # vanilla MLDA and AEM MLDA
+    postMeans = np.empty((4, DIM))
+    tgtMean, surMean, vMLDAPostMean, aMLDAPostMean = postMeans
 
-tgtThinning = integrated_autocorrelation(tgtStates, 'mean')
-tgtMean = np.mean(tgtStates[tgtBurnin::tgtThinning], axis=0)
+    initState = ParameterVector(np.zeros(DIM))
 
-tgtAccPr = tgtMRW.diagnostics.global_acceptance_rate()
+    print(f"\nRunning {nChains} x {tgtNSteps} steps of the target MRW")
 
-surNSteps = 50000
-surBurnin = 500
+    tgtStates, tgtDiagnostics = run_chains_parallel(
+        tgtBuilder, nChains, tgtNSteps, initState, seed=2223)
 
-initState = ParameterVector(np.zeros(DIM))
+    tgtThinning = max(integrated_autocorrelation(states[tgtBurnin:], 'mean')
+                      for states in tgtStates)
+    tgtMRWSamples = tgtStates[:, tgtBurnin::tgtThinning].reshape(-1, DIM)
+    np.mean(tgtMRWSamples, axis=0, dtype=np.float64, out=tgtMean)
 
-print(f"\nRunning {surNSteps} steps of the surrogate MRW")
+    tgtAccPr = np.mean([dgnstc.global_acceptance_rate()
+                        for dgnstc in tgtDiagnostics])
 
-surMRW.run(surNSteps, initState)
-surStates = surMRW.chain.trajectory
+    surNSteps = 50000 // nChains
+    surBurnin = 500
 
-surThinning = integrated_autocorrelation(surStates, 'mean')
-surMean = np.mean(surStates[surBurnin::surThinning], axis=0)
-surAccPr = surMRW.diagnostics.global_acceptance_rate()
+    print(f"\nRunning {nChains} x {surNSteps} steps of the surrogate MRW")
 
-# start the actual burn-in chain where the surrogate chain left off
-initState = ParameterVector(surStates[-1])
-nSteps = 500
+    surStates, surDiagnostics = run_chains_parallel(
+        surBuilder, nChains, surNSteps, initState, seed=2224)
 
-print(f"\n\n\nBurning-in MLDA with {nSteps} steps, starting at last surrogate chain "
-      "position")
+    surThinning = max(integrated_autocorrelation(states[surBurnin:], 'mean')
+                      for states in surStates)
+    surMRWSamples = surStates[:, surBurnin::surThinning].reshape(-1, DIM)
+    np.mean(surMRWSamples, axis=0, dtype=np.float64, out=surMean)
 
-mldaBurnin.run(nSteps, initState)
+    surAccPr = np.mean([dgnstc.global_acceptance_rate()
+                        for dgnstc in surDiagnostics])
 
-initState = ParameterVector(mldaBurnin.chain.trajectory[-1])
-initStateCopy = np.copy(initState)
+    # start the actual burn-in chain where the first surrogate chain left off
+    initState = ParameterVector(surStates[0, -1])
+    nSteps = 500
 
-nSteps = 50000
+    print(f"\n\n\nBurning-in MLDA with {nSteps} steps, starting at last surrogate chain "
+          "position")
 
-print(f"\n\n\nRunning {nSteps} steps of vanilla MLDA")
+    mldaBurnin.run(nSteps, initState)
 
-vanillaMLDA.run(nSteps, initState)
+    initState = ParameterVector(mldaBurnin.chain.trajectory[-1])
 
-vMLDAStates = vanillaMLDA.chain.trajectory
-vMLDAThinning = integrated_autocorrelation(vMLDAStates, 'max')
-vMLDAPostMean = np.mean(vMLDAStates[::vMLDAThinning], axis=0)
-vMLDAAccPr = vanillaMLDA.diagnostics.global_acceptance_rate()
+    nSteps = 50000
 
-print(f"\n\n\nRunning {nSteps} steps of MLDA with an adaptive error model")
+    print(f"\n\n\nRunning {nSteps} steps of vanilla MLDA")
 
-nSteps = 50000
-assert initState == initStateCopy
+    vanillaMLDA.run(nSteps, initState)
 
-aemMLDA.run(nSteps, initState)
+    vMLDAStates = vanillaMLDA.chain.trajectory
+    vMLDAThinning = integrated_autocorrelation(vMLDAStates, 'max')
+    np.mean(vMLDAStates[::vMLDAThinning], axis=0, dtype=np.float64,
+            out=vMLDAPostMean)
+    vMLDAAccPr = vanillaMLDA.diagnostics.global_acceptance_rate()
 
-aMLDAStates = aemMLDA.chain.trajectory
-aMLDAThinning = integrated_autocorrelation(aMLDAStates, 'max')
-aMLDAPostMean = np.mean(aMLDAStates[::aMLDAThinning], axis=0)
-aMLDAAccPr = aemMLDA.diagnostics.global_acceptance_rate()
+    print(f"\n\n\nRunning {nSteps} steps of MLDA with an adaptive error model")
 
-print("\n\nResults for target MRW")
-print("----------------------")
-print(f"\nacceptance rate: {tgtAccPr}")
-print(f"IAT estimate: {tgtThinning}")
-print(f"posterior mean: {tgtMean}")
+    nSteps = 50000
 
-print(f"Likelihood cache hits: {vanillaSurLikelihood._llCache.hits}")
-print(f"Likelihood cache misses: {vanillaSurLikelihood._llCache.misses}")
+    aemMLDA.run(nSteps, initState)
 
-print("\n\nResults for surrogate MRW")
-print("----------------------")
-print(f"\nacceptance rate: {surAccPr}")
-print(f"IAT estimate: {surThinning}")
-print(f"posterior mean: {surMean}")
+    aMLDAStates = aemMLDA.chain.trajectory
+    aMLDAThinning = integrated_autocorrelation(aMLDAStates, 'max')
+    np.mean(aMLDAStates[::aMLDAThinning], axis=0, dtype=np.float64,
+            out=aMLDAPostMean)
+    aMLDAAccPr = aemMLDA.diagnostics.global_acceptance_rate()
 
-print("\n\nResults for vanilla MLDA")
-print("-------------------------")
-print(f"acceptance rate: {vMLDAAccPr}")
-print(f"IAT estimate: {vMLDAThinning}")
-print(f"posterior mean: {vMLDAPostMean}")
+    print("\n\nResults for target MRW")
+    print("----------------------")
+    print(f"\nacceptance rate: {tgtAccPr}")
+    print(f"IAT estimate: {tgtThinning}")
+    print(f"posterior mean: {tgtMean}")
 
-print(f"\n\nResults for AEM MLDA")
-print("---------------------")
-print(f"acceptance rate: {aMLDAAccPr}")
-print(f"IAT estimate: {aMLDAThinning}")
-print(f"posterior mean: {aMLDAPostMean}")
-print(f"estimated mean error: {aemSurLikelihood.accumulator.mean()}")
+    print(f"Likelihood cache hits: {vanillaSurLikelihood._llCache.hits}")
+    print(f"Likelihood cache misses: {vanillaSurLikelihood._llCache.misses}")
 
-print("\nAEM DETAILS:")
+    print("\n\nResults for surrogate MRW")
+    print("----------------------")
+    print(f"\nacceptance rate: {surAccPr}")
+    print(f"IAT estimate: {surThinning}")
+    print(f"posterior mean: {surMean}")
 
-print(
-    f"Estimated Marginal Variance of posterior: {aemMLDA.diagnostics.marginal_variance()}")
-print("Total number of carried out surrogate evaluations: "
-      f"{aemSurLikelihood.number_of_model_evaluations()}")
-print("Total number of carried out target evaluations: "
-      f"{aemTgtLikelihood.number_of_model_evaluations()}")
+    print("\n\nResults for vanilla MLDA")
+    print("-------------------------")
+    print(f"acceptance rate: {vMLDAAccPr}")
+    print(f"IAT estimate: {vMLDAThinning}")
+    print(f"posterior mean: {vMLDAPostMean}")
 
-print(f"surrogate cache hits: {aemSurLikelihood._cache.hits}")
-print(f"surrogate cache misses: {aemSurLikelihood._cache.misses}")
+    print(f"\n\nResults for AEM MLDA")
+    print("---------------------")
+    print(f"acceptance rate: {aMLDAAccPr}")
+    print(f"IAT estimate: {aMLDAThinning}")
+    print(f"posterior mean: {aMLDAPostMean}")
+    print(f"estimated mean error: {aemSurLikelihood.accumulator.mean()}")
 
-print(f"target cache hits: {aemTgtLikelihood._cache.hits}")
-print(f"target cache misses: {aemTgtLikelihood._cache.misses}")
+    print("\nAEM DETAILS:")
 
-if aemSurLikelihood.accumulator.nData > 1:
-    print("estimated error marginal variance: "
-          f"{aemSurLikelihood.accumulator.marginal_variance()}")
+    print(
+        f"Estimated Marginal Variance of posterior: {aemMLDA.diagnostics.marginal_variance()}")
+    print("Total number of carried out surrogate evaluations: "
+          f"{aemSurLikelihood.number_of_model_evaluations()}")
+    print("Total number of carried out target evaluations: "
+          f"{aemTgtLikelihood.number_of_model_evaluations()}")
 
-# -----------------------------------------------------------------------------
-#                                PLOTTING
-# -----------------------------------------------------------------------------
+    print(f"surrogate cache hits: {aemSurLikelihood._cache.hits}")
+    print(f"surrogate cache misses: {aemSurLikelihood._cache.misses}")
+
+    print(f"target cache hits: {aemTgtLikelihood._cache.hits}")
+    print(f"target cache misses: {aemTgtLikelihood._cache.misses}")
+
+    print("surrogate forward model cache hits: "
+          f"{surFwdModel.evaluationCache.hits}")
+    print("target forward model cache hits: "
+          f"{tgtFwdModel.evaluationCache.hits}")
 
-fig, ax = plt.subplots(1, 4, figsize=(12, 6))
+    if aemSurLikelihood.accumulator.nData > 1:
+        print("estimated error marginal variance: "
+              f"{aemSurLikelihood.accumulator.marginal_variance()}")
 
-xGrid = np.linspace(-3., 4., 100)
-yGrid = np.linspace(-1., 2., 100)
+    # -------------------------------------------------------------------------
+    #                                PLOTTING
+    # -------------------------------------------------------------------------
 
-# Create a grid for the contour plot
-X, Y = np.meshgrid(xGrid, yGrid)
-mesh = np.dstack((X, Y))
+    fig, ax = plt.subplots(1, 4, figsize=(12, 6))
 
+    xGrid = np.linspace(-3., 4., 100)
+    yGrid = np.linspace(-1., 2., 100)
 
-# --------------------- PLOT 1: TARGET MRW CHAIN ------------------------------
+    # Create a grid for the contour plot
+    X, Y = np.meshgrid(xGrid, yGrid)
 
-tgtDensityEval = evaluate_posterior(mesh, vanillaTgtLikelihood, prior.level(0))
-ax[0].contour(X, Y, tgtDensityEval, levels=4, cmap='Blues')
-
-tgtMRWSamples = tgtMRW.chain.trajectory[tgtBurnin::tgtThinning]
-
-burninX = [state[0] for state in tgtMRW.chain.trajectory[:tgtBurnin]]
-burninY = [state[1] for state in tgtMRW.chain.trajectory[:tgtBurnin]]
-
-mcmcX = [sample[0] for sample in tgtMRWSamples]
-mcmcY = [sample[1] for sample in tgtMRWSamples]
-
-# Plot the Markov chain trajectory
-# ax[0].plot(burninX, burninY, color='green', alpha=0.1, label='burn-in')
-ax[0].scatter(burninX, burninY, color='green', alpha=0.2)
-ax[0].scatter(
-    mcmcX, mcmcY,
-    color='gray', marker='o', s=40, alpha=0.2,
-    label='selected samples')
-ax[0].scatter(tgtMean[0], tgtMean[1], color='black', s=100,
-              marker='P', label='estimated tgtrogate mean')
-# Add labels, legend, and grid
-ax[0].set_title('Target MRW Chain', fontsize=24)
-ax[0].set_xlabel('X')
-ax[0].set_ylabel('Y')
-ax[0].legend(fontsize=14)
-ax[0].grid(True, which='both', linestyle='--', linewidth=0.5,
-           color='gray', alpha=0.7)
 
-# Add acceptance rate and IAT
-ax[0].text(0.55, 0.9,
-           f"acceptance prob.: {tgtAccPr:.3f}\nIAT estimate: {tgtThinning}",
-           transform=ax[0].transAxes, ha='right', va='top', fontsize=20,
-           color='black', bbox=dict(facecolor='white',
-                                    edgecolor='k',
-                                    alpha=0.7))
-
-
-# ----------------- PLOT 2: SURROGATE CHAIN -----------------------------------
-
-surDensityEval = evaluate_posterior(mesh, vanillaSurLikelihood, prior.level(0))
-ax[1].contour(X, Y, surDensityEval, levels=4, cmap='Reds')
-
-surMRWSamples = surMRW.chain.trajectory[surBurnin::surThinning]
-
-burninX = [state[0] for state in surMRW.chain.trajectory[:surBurnin]]
-burninY = [state[1] for state in surMRW.chain.trajectory[:surBurnin]]
-
-mcmcX = [sample[0] for sample in surMRWSamples]
-mcmcY = [sample[1] for sample in surMRWSamples]
-
-# Plot the Markov chain trajectory
-# ax[1].plot(burninX, burninY, color='green', alpha=0.1, label='burn-in')
-ax[1].scatter(burninX, burninY, color='green', alpha=0.2)
-ax[1].scatter(
-    mcmcX, mcmcY,
-    color='gray', marker='o', s=40, alpha=0.2,
-    label='selected samples')
-ax[1].scatter(surMean[0], surMean[1], color='black', s=100,
-              marker='P', label='estimated surrogate mean')
-
-# Add labels, legend, and grid
-ax[1].set_title('Surrogate Chain', fontsize=24)
-ax[1].set_xlabel('X')
-ax[1].set_ylabel('Y')
-ax[1].legend(fontsize=14)
-ax[1].grid(True, which='both', linestyle='--', linewidth=0.5,
-           color='gray', alpha=0.7)
-
-# Add acceptance rate and IAT
-ax[1].text(0.55, 0.9, f"acceptance prob.: {surAccPr:.3f}\nIAT estimate: {surThinning}",
-           transform=ax[1].transAxes, ha='right', va='top', fontsize=20, color='black',
-           bbox=dict(facecolor='white', edgecolor='k', alpha=0.7))
-
-
-# -------------------- PLOT 3: VANILLA MLDA -----------------------------------
-
-tgtDensityEval = evaluate_posterior(mesh, vanillaTgtLikelihood, prior.level(0))
-
-ax[2].contour(X, Y, surDensityEval, levels=4, cmap='Reds')
-ax[2].contour(X, Y, tgtDensityEval, levels=4, cmap='Blues')
-
-vMLDASamples = vMLDAStates[::vMLDAThinning]
-
-# Extract x and y coordinates
-burninX = [state[0] for state in mldaBurnin.chain.trajectory]
-burninY = [state[1] for state in mldaBurnin.chain.trajectory]
-mcmcX = [sample[0] for sample in vMLDASamples]
-mcmcY = [sample[1] for sample in vMLDASamples]
-
-# Plot the Markov chain trajectory
-# ax[2].scatter(burninX, burninY, color='green', alpha=0.2)
-ax[2].scatter(
-    mcmcX, mcmcY,
-    color='gray', marker='o', s=40, alpha=0.2,
-    label='selected samples')
-ax[2].scatter(vMLDAPostMean[0], vMLDAPostMean[1], color='black', s=100,
-              marker='P', label='estimated posterior mean')
-
-# Add labels, legend, and grid
-ax[2].set_title('Vanilla MLDA', fontsize=24)
-ax[2].set_xlabel('X')
-ax[2].set_ylabel('Y')
-ax[2].legend(fontsize=14)
-ax[2].grid(True, which='both', linestyle='--', linewidth=0.5,
-           color='gray', alpha=0.7)
-
-# Add acceptance rate and IAT
-ax[2].text(0.55, 0.9, f"acceptance prob.: {vMLDAAccPr:.3f}\nIAT estimate: {vMLDAThinning}",
-           transform=ax[2].transAxes, ha='right', va='top', fontsize=20, color='black',
-           bbox=dict(facecolor='white', edgecolor='k', alpha=0.7))
-
-# ------------------------ PLOT 4: AEM MLDA -----------------------------------
-
-corrTgtDensityEval = evaluate_posterior(mesh, aemTgtLikelihood, prior.level(0))
-corrSurDensityEval = evaluate_posterior(mesh, aemSurLikelihood, prior.level(0))
-
-ax[3].contour(X, Y, corrTgtDensityEval, levels=4, cmap='Blues')
-ax[3].contour(X, Y, corrSurDensityEval, levels=4, cmap='Reds')
-
-aMLDASamples = aMLDAStates[::aMLDAThinning]
-
-# Extract x and y coordinates
-burninX = [state[0] for state in mldaBurnin.chain.trajectory]
-burninY = [state[1] for state in mldaBurnin.chain.trajectory]
-mcmcX = [sample[0] for sample in aMLDASamples]
-mcmcY = [sample[1] for sample in aMLDASamples]
-
-# Plot the Markov chain trajectory
-# ax[3].scatter(burninX, burninY, color='green', alpha=0.2)
-ax[3].scatter(
-    mcmcX, mcmcY,
-    color='gray', marker='o', s=40, alpha=0.2,
-    label='selected samples')
-ax[3].scatter(aMLDAPostMean[0], aMLDAPostMean[1], color='black', s=100,
-              marker='P', label='estimated posterior mean')
-
-# Add labels, legend, and grid
-ax[3].set_title('MLDA with AEM + noise scaling', fontsize=24)
-ax[3].set_xlabel('X')
-ax[3].set_ylabel('Y')
-ax[3].legend(fontsize=14)
-ax[3].grid(True, which='both', linestyle='--', linewidth=0.5,
-           color='gray', alpha=0.7)
-
-# Add acceptance rate and IAT
-ax[3].text(0.55, 0.9, f"acceptance prob.: {aMLDAAccPr:.3f}\nIAT estimate: {aMLDAThinning}",
-           transform=ax[3].transAxes, ha='right', va='top', fontsize=20, color='black',
-           bbox=dict(facecolor='white', edgecolor='k', alpha=0.7))
-
-plt.show()
+    # --------------------- PLOT 1: TARGET MRW CHAIN --------------------------
+
+    tgtDensityEval = evaluate_posterior(xGrid, yGrid, vanillaTgtLikelihood,
+                                        prior.level(0))
+    ax[0].contour(X, Y, tgtDensityEval, levels=4, cmap='Blues')
+
+    burninX = tgtStates[0, :tgtBurnin, 0]
+    burninY = tgtStates[0, :tgtBurnin, 1]
+
+    mcmcX = tgtMRWSamples[:, 0]
+    mcmcY = tgtMRWSamples[:, 1]
+
+    # Plot the Markov chain trajectory
+    # ax[0].plot(burninX, burninY, color='green', alpha=0.1, label='burn-in')
+    ax[0].scatter(burninX, burninY, color='green', alpha=0.2)
+    ax[0].scatter(
+        mcmcX, mcmcY,
+        color='gray', marker='o', s=40, alpha=0.2,
+        label='selected samples')
+    ax[0].scatter(tgtMean[0], tgtMean[1], color='black', s=100,
+                  marker='P', label='estimated tgtrogate mean')
+    # Add labels, legend, and grid
+    ax[0].set_title('Target MRW Chain', fontsize=24)
+    ax[0].set_xlabel('X')
+    ax[0].set_ylabel('Y')
+    ax[0].legend(fontsize=14)
+    ax[0].grid(True, which='both', linestyle='--', linewidth=0.5,
+               color='gray', alpha=0.7)
+
+    # Add acceptance rate and IAT
+    ax[0].text(0.55, 0.9,
+               f"acceptance prob.: {tgtAccPr:.3f}\nIAT estimate: {tgtThinning}",
+               transform=ax[0].transAxes, ha='right', va='top', fontsize=20,
+               color='black', bbox=dict(facecolor='white',
+                                        edgecolor='k',
+                                        alpha=0.7))
+
+
+    # ----------------- PLOT 2: SURROGATE CHAIN -------------------------------
+
+    surDensityEval = evaluate_posterior(xGrid, yGrid, vanillaSurLikelihood,
+                                        prior.level(0))
+    ax[1].contour(X, Y, surDensityEval, levels=4, cmap='Reds')
+
+    burninX = surStates[0, :surBurnin, 0]
+    burninY = surStates[0, :surBurnin, 1]
+
+    mcmcX = surMRWSamples[:, 0]
+    mcmcY = surMRWSamples[:, 1]
+
+    # Plot the Markov chain trajectory
+    # ax[1].plot(burninX, burninY, color='green', alpha=0.1, label='burn-in')
+    ax[1].scatter(burninX, burninY, color='green', alpha=0.2)
+    ax[1].scatter(
+        mcmcX, mcmcY,
+        color='gray', marker='o', s=40, alpha=0.2,
+        label='selected samples')
+    ax[1].scatter(surMean[0], surMean[1], color='black', s=100,
+                  marker='P', label='estimated surrogate mean')
+
+    # Add labels, legend, and grid
+    ax[1].set_title('Surrogate Chain', fontsize=24)
+    ax[1].set_xlabel('X')
+    ax[1].set_ylabel('Y')
+    ax[1].legend(fontsize=14)
+    ax[1].grid(True, which='both', linestyle='--', linewidth=0.5,
+               color='gray', alpha=0.7)
+
+    # Add acceptance rate and IAT
+    ax[1].text(0.55, 0.9, f"acceptance prob.: {surAccPr:.3f}\nIAT estimate: {surThinning}",
+               transform=ax[1].transAxes, ha='right', va='top', fontsize=20, color='black',
+               bbox=dict(facecolor='white', edgecolor='k', alpha=0.7))
+
+
+    # -------------------- PLOT 3: VANILLA MLDA -------------------------------
+
+    tgtDensityEval = evaluate_posterior(xGrid, yGrid, vanillaTgtLikelihood,
+                                        prior.level(0))
+
+    ax[2].contour(X, Y, surDensityEval, levels=4, cmap='Reds')
+    ax[2].contour(X, Y, tgtDensityEval, levels=4, cmap='Blues')
+
+    vMLDASamples = vMLDAStates[::vMLDAThinning]
+
+    # Extract x and y coordinates
+    burninX = mldaBurnin.chain.trajectory[:, 0]
+    burninY = mldaBurnin.chain.trajectory[:, 1]
+    mcmcX = vMLDASamples[:, 0]
+    mcmcY = vMLDASamples[:, 1]
+
+    # Plot the Markov chain trajectory
+    # ax[2].scatter(burninX, burninY, color='green', alpha=0.2)
+    ax[2].scatter(
+        mcmcX, mcmcY,
+        color='gray', marker='o', s=40, alpha=0.2,
+        label='selected samples')
+    ax[2].scatter(vMLDAPostMean[0], vMLDAPostMean[1], color='black', s=100,
+                  marker='P', label='estimated posterior mean')
+
+    # Add labels, legend, and grid
+    ax[2].set_title('Vanilla MLDA', fontsize=24)
+    ax[2].set_xlabel('X')
+    ax[2].set_ylabel('Y')
+    ax[2].legend(fontsize=14)
+    ax[2].grid(True, which='both', linestyle='--', linewidth=0.5,
+               color='gray', alpha=0.7)
+
+    # Add acceptance rate and IAT
+    ax[2].text(0.55, 0.9, f"acceptance prob.: {vMLDAAccPr:.3f}\nIAT estimate: {vMLDAThinning}",
+               transform=ax[2].transAxes, ha='right', va='top', fontsize=20, color='black',
+               bbox=dict(facecolor='white', edgecolor='k', alpha=0.7))
+
+    # ------------------------ PLOT 4: AEM MLDA -------------------------------
+
+    corrTgtDensityEval = evaluate_posterior(xGrid, yGrid, aemTgtLikelihood,
+                                            prior.level(0))
+    corrSurDensityEval = evaluate_posterior(xGrid, yGrid, aemSurLikelihood,
+                                            prior.level(0))
+
+    ax[3].contour(X, Y, corrTgtDensityEval, levels=4, cmap='Blues')
+    ax[3].contour(X, Y, corrSurDensityEval, levels=4, cmap='Reds')
+
+    aMLDASamples = aMLDAStates[::aMLDAThinning]
+
+    # Extract x and y coordinates
+    burninX = mldaBurnin.chain.trajectory[:, 0]
+    burninY = mldaBurnin.chain.trajectory[:, 1]
+    mcmcX = aMLDASamples[:, 0]
+    mcmcY = aMLDASamples[:, 1]
+
+    # Plot the Markov chain trajectory
+    # ax[3].scatter(burninX, burninY, color='green', alpha=0.2)
+    ax[3].scatter(
+        mcmcX, mcmcY,
+        color='gray', marker='o', s=40, alpha=0.2,
+        label='selected samples')
+    ax[3].scatter(aMLDAPostMean[0], aMLDAPostMean[1], color='black', s=100,
+                  marker='P', label='estimated posterior mean')
+
+    # Add labels, legend, and grid
+    ax[3].set_title('MLDA with AEM + noise scaling', fontsize=24)
+    ax[3].set_xlabel('X')
+    ax[3].set_ylabel('Y')
+    ax[3].legend(fontsize=14)
+    ax[3].grid(True, which='both', linestyle='--', linewidth=0.5,
+               color='gray', alpha=0.7)
+
+    # Add acceptance rate and IAT
+    ax[3].text(0.55, 0.9, f"acceptance prob.: {aMLDAAccPr:.3f}\nIAT estimate: {aMLDAThinning}",
+               transform=ax[3].transAxes, ha='right', va='top', fontsize=20, color='black',
+               bbox=dict(facecolor='white', edgecolor='k', alpha=0.7))
+
+    plt.show()
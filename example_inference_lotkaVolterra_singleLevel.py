@@ -3,9 +3,9 @@ import yagremcmc.test.testSetup as setup
 import numpy as np
 import matplotlib.pyplot as plt
 
-from numpy.random import uniform
 from yagremcmc.model.forwardModel import ForwardModel
 from yagremcmc.chain.method.mrw import MRWBuilder
+from yagremcmc.chain.method.am import AdaptiveMRWBuilder
 from yagremcmc.chain.method.pcn import PCNBuilder
 from yagremcmc.statistics.gaussian import Gaussian
 from yagremcmc.statistics.covariance import DiagonalCovarianceMatrix, IIDCovarianceMatrix
@@ -14,10 +14,10 @@ from yagremcmc.statistics.likelihood import AdditiveGaussianNoiseLikelihood
 from yagremcmc.statistics.bayesModel import BayesianRegressionModel
 from yagremcmc.postprocessing.autocorrelation import integrated_autocorrelation
 
-np.random.seed(1111)
+rng = np.random.default_rng(1111)
 
-# available options are 'mrw', 'pcn'
-method = 'mrw'
+# available options are 'mrw', 'am', 'pcn'
+method = 'am'
 
 if method != 'pcn':
 
@@ -33,8 +33,10 @@ config = {
     'nData': 10,
     'dataDim': 2,
     'solver': 'LSODA',
+    'jacobian': True,
+    'firstStepHint': True,
     'rtol': 1e-4}
-design = np.array([uniform(0.5, 1.5, 2) for _ in range(config['nData'])])
+design = rng.uniform(0.5, 1.5, (config['nData'], 2))
 
 # define forward problem
 solver = setup.LotkaVolterraSolver(design, config)
@@ -48,7 +50,7 @@ assert groundTruth.dimension == parameterDim
 
 # generate data
 dataNoiseVar = 0.04
-data = setup.generate_synthetic_data(groundTruth, solver, dataNoiseVar)
+data = setup.generate_synthetic_data(groundTruth, solver, dataNoiseVar, rng)
 
 print("synthetic data generated")
 
@@ -75,7 +77,7 @@ if method == 'pcn':
     chainBuilder = PCNBuilder()
     chainBuilder.stepSize = 0.01
 
-elif method == 'mrw':
+elif method in ('mrw', 'am'):
 
     if proposalCovType == 'iid':
 
@@ -91,27 +93,65 @@ elif method == 'mrw':
         raise ValueError(
             "Unknown Proposal covariance type: " + proposalCovType)
 
-    chainBuilder = MRWBuilder()
-    chainBuilder.proposalCovariance = proposalCov
+    if method == 'mrw':
+
+        chainBuilder = MRWBuilder()
+        chainBuilder.proposalCovariance = proposalCov
+
+    else:
+
+        # the proposal covariance is learned from the chain, so the initial
+        # covariance only needs to be roughly of the right scale
+        chainBuilder = AdaptiveMRWBuilder()
+        chainBuilder.initialCovariance = proposalCov
+        chainBuilder.idleSteps = 100
+        chainBuilder.collectionSteps = 400
+        chainBuilder.adaptionInterval = 20
 
 else:
     raise ValueError("Unknown MCMC method: " + method)
 
 chainBuilder.bayesModel = statModel
+chainBuilder.rng = rng
 
 sampler = chainBuilder.build_method()
 
-# run mcmc
-nSteps = 5000
+# pilot run to determine burn-in and thinning of the production run
+nPilot = 2000
 initState = setup.LotkaVolterraParameter.from_coefficient(np.array([-7., 2.8]))
-sampler.run(nSteps, initState)
+sampler.run(nPilot, initState)
 
 states = sampler.chain.trajectory
 
 burnIn = 100
 thinningStep = integrated_autocorrelation(states[burnIn:], 'max')
 
-mcmcSamples = states[burnIn::thinningStep]
+# the production run starts from the end of the pilot run, such that no
+# further burn-in is required. Only the thinned states are stored.
+nSteps = 5000
+prodState = setup.LotkaVolterraParameter.from_coefficient(states[-1])
+
+if method == 'am':
+
+    # a new run of the adaptive chain would start the adaption over, and the
+    # thinned chain would not collect enough states to adapt again. The
+    # production run therefore keeps the proposal learned in the pilot run
+    prodBuilder = MRWBuilder()
+    prodBuilder.bayesModel = statModel
+    prodBuilder.proposalCovariance = sampler.proposalCovariance
+    prodBuilder.rng = rng
+
+    sampler = prodBuilder.build_method()
+
+else:
+
+    # report the acceptance rate of the production run only
+    sampler.diagnostics.reset()
+
+sampler.chain.thinning = thinningStep
+sampler.run(nSteps, prodState)
+
+mcmcSamples = sampler.chain.trajectory
 meanState = setup.LotkaVolterraParameter.from_coefficient(
     np.mean(states, axis=0))
 posteriorMean = setup.LotkaVolterraParameter.from_coefficient(
@@ -123,18 +163,18 @@ print(f"raw posterior mean: {meanState.evaluate()}")
 print(f"processed posterior mean: {posteriorMean.evaluate()}")
 print(f"Acceptance rate: {sampler.diagnostics.global_acceptance_rate()}")
 print(f"IAT estimate: {thinningStep}")
-print(f"effective sample size: {(nSteps - burnIn) // thinningStep}")
+print(f"effective sample size: {sampler.chain.length}")
 
 # Plotting
 fig, ax = plt.subplots(1, 2)
 plt.rcParams["figure.figsize"] = (8, 6)
 
 # Extract x and y coordinates
-chainX = [state[0] for state in states]
-chainY = [state[1] for state in states]
+chainX = states[:, 0]
+chainY = states[:, 1]
 
-mcmcX = [sample[0] for sample in mcmcSamples]
-mcmcY = [sample[1] for sample in mcmcSamples]
+mcmcX = mcmcSamples[:, 0]
+mcmcY = mcmcSamples[:, 1]
 
 # Plot the Markov chain trajectory
 ax[0].plot(chainX[:burnIn], chainY[:burnIn], color='gray', alpha=0.4,
@@ -3,7 +3,6 @@ import yagremcmc.test.testSetup as setup
 import numpy as np
 import matplotlib.pyplot as plt
 
-from numpy.random import uniform
 from yagremcmc.model.forwardModel import ForwardModel
 from yagremcmc.chain.method.mlda import MLDABuilder
 from yagremcmc.statistics.gaussian import Gaussian
@@ -14,7 +13,7 @@ from yagremcmc.statistics.modelHierarchy import BayesianModelHierarchyFactory
 from yagremcmc.utility.hierarchy import shared, hierarchical
 from yagremcmc.postprocessing.autocorrelation import integrated_autocorrelation
 
-np.random.seed(1112)
+rng = np.random.default_rng(1112)
 
 # available options are 'mrw', 'pcn'
 method = 'mrw'
@@ -25,14 +24,20 @@ if method != 'pcn':
     # this will be used as the initial covariance.
     proposalCovType = 'iid'
 
-# define (non-stiff) model problem
+# define model problem. The surrogate uses a cheap fixed-step RK4 scheme,
+# which integrates all design points at once. Close to extinction states,
+# visited during burn-in, the problem is stiff and RK4 diverges. These
+# evaluations are repeated with LSODA and the analytic Jacobian.
 surrogateConfig = {
     'T': 10.,
     'alpha': 0.8,
     'gamma': 0.4,
     'nData': 10,
     'dataDim': 2,
-    'solver': 'RK23',
+    'solver': 'RK4',
+    'nTimeSteps': 50,
+    'fallbackSolver': 'LSODA',
+    'jacobian': True,
     'rtol': 1e-2}
 targetConfig = {
     'T': 10.,
@@ -42,14 +47,16 @@ targetConfig = {
     'dataDim': 2,
     'solver': 'DOP853',
     'rtol': 1e-5}
-design = np.array([uniform(0.5, 1.5, 2) for _ in range(targetConfig['nData'])])
+design = rng.uniform(0.5, 1.5, (targetConfig['nData'], 2))
 
 # define forward problem
 surrogateSolver = setup.LotkaVolterraSolver(design, surrogateConfig)
 targetSolver = setup.LotkaVolterraSolver(design, targetConfig)
 
-surrogateModel = ForwardModel(surrogateSolver)
-targetModel = ForwardModel(targetSolver)
+# memoise ODE solves for states that are revisited across the MLDA levels
+fwdCacheSize = 12
+surrogateModel = ForwardModel(surrogateSolver, fwdCacheSize)
+targetModel = ForwardModel(targetSolver, fwdCacheSize)
 
 # define problem parameters
 parameterDim = 2
@@ -59,7 +66,8 @@ assert groundTruth.dimension == parameterDim
 
 # generate data
 dataNoiseVar = 0.04
-data = setup.generate_synthetic_data(groundTruth, targetSolver, dataNoiseVar)
+data = setup.generate_synthetic_data(groundTruth, targetSolver, dataNoiseVar,
+                                     rng)
 
 print("synthetic data generated")
 
@@ -104,6 +112,7 @@ chainBuilder.baseProposalCovariance = basePropCov
 chainBuilder.bayesModel = statModel
 chainBuilder.baseProposalCovariance = basePropCov
 chainBuilder.subChainLengths = [3]
+chainBuilder.rng = rng
 
 sampler = chainBuilder.build_method()
 
@@ -136,11 +145,11 @@ fig, ax = plt.subplots(1, 2)
 plt.rcParams["figure.figsize"] = (8, 6)
 
 # Extract x and y coordinates
-chainX = [state[0] for state in states]
-chainY = [state[1] for state in states]
+chainX = states[:, 0]
+chainY = states[:, 1]
 
-mcmcX = [sample[0] for sample in mcmcSamples]
-mcmcY = [sample[1] for sample in mcmcSamples]
+mcmcX = mcmcSamples[:, 0]
+mcmcY = mcmcSamples[:, 1]
 
 # Plot the Markov chain trajectory
 ax[0].plot(chainX[:burnIn], chainY[:burnIn], color='gray', alpha=0.4,
@@ -29,22 +29,23 @@ nSteps = int(1e5)
 initState = ScalarParameter(np.array([-3.]))
 mcmc.run(nSteps, initState)
 
-states = np.array(mcmc.chain.trajectory)
+states = mcmc.chain.trajectory
 
 # postprocessing
 burnin = int(0.02 * nSteps)
 
 assert nSteps > burnin
 
+postBurnin = states[burnin:]
+
 # estimate autocorrelation function
-acf = ac.estimate_autocorrelation_function_1d(states[burnin:])
+acf = ac.estimate_autocorrelation_function_1d(postBurnin)
 
-meanIAT = ac.integrated_autocorrelation(states[burnin:], 'mean')
-maxIAT = ac.integrated_autocorrelation(states[burnin:], 'max')
+meanIAT, maxIAT = ac.mean_and_max_integrated_autocorrelation(postBurnin)
 
 thinningStep = maxIAT
 
-mcmcSamples = states[burnin::thinningStep]
+mcmcSamples = postBurnin[::thinningStep]
 
 # estimate mean
 meanState = np.mean(states, axis=0)
@@ -47,10 +47,10 @@ initState = ParameterVector(np.array([-9., -7.]))
 
 # run both chains
 vanillaMLDA.run(nSteps, initState)
-vanillaMLDAStates = np.array(vanillaMLDA.chain.trajectory)
+vanillaMLDAStates = vanillaMLDA.chain.trajectory
 
 correctedMLDA.run(nSteps, initState)
-correctedMLDAStates = np.array(correctedMLDA.chain.trajectory)
+correctedMLDAStates = correctedMLDA.chain.trajectory
 
 # postprocessing
 dim = tgtMean.dimension
@@ -160,11 +160,11 @@ for i in [0, 1]:
 
     meanEst = np.mean(samples, axis=0)
 
-    chainX = [state[0] for state in states]
-    chainY = [state[1] for state in states]
+    chainX = states[:, 0]
+    chainY = states[:, 1]
 
-    mcmcX = [sample[0] for sample in samples]
-    mcmcY = [sample[1] for sample in samples]
+    mcmcX = samples[:, 0]
+    mcmcY = samples[:, 1]
 
     ax[i].set_title(titleStr)
     ax[i].set_xlabel('X')
@@ -59,24 +59,23 @@ nSteps = 100000
 initState = ParameterVector(np.array([-8., -7.]))
 mcmc.run(nSteps, initState)
 
-states = np.array(mcmc.chain.trajectory)
+states = mcmc.chain.trajectory
 
 # postprocessing
-dim = tgtMean.dimension
 burnin = 1000
 
 assert nSteps > burnin
 
-# estimate autocorrelation function
-acf = [ac.estimate_autocorrelation_function_1d(
-    states[burnin:, d]) for d in range(dim)]
+postBurnin = states[burnin:]
 
-meanIAT = ac.integrated_autocorrelation(states[burnin:], 'mean')
-maxIAT = ac.integrated_autocorrelation(states[burnin:], 'max')
+# estimate autocorrelation functions, one per coordinate
+acf = ac.estimate_autocorrelation_function_nd(postBurnin).T
+
+meanIAT, maxIAT = ac.mean_and_max_integrated_autocorrelation(postBurnin)
 
 thinningStep = maxIAT
 
-mcmcSamples = states[burnin::thinningStep]
+mcmcSamples = postBurnin[::thinningStep]
 
 # estimate mean
 meanState = np.mean(states, axis=0)
@@ -110,11 +109,11 @@ plt.figure(figsize=(8, 6))
 plt.contour(X, Y, densityEval, levels=10, cmap='viridis')
 
 # Extract x and y coordinates
-chainX = [state[0] for state in states]
-chainY = [state[1] for state in states]
+chainX = states[:, 0]
+chainY = states[:, 1]
 
-mcmcX = [sample[0] for sample in mcmcSamples]
-mcmcY = [sample[1] for sample in mcmcSamples]
+mcmcX = mcmcSamples[:, 0]
+mcmcY = mcmcSamples[:, 1]
 
 
 # Plot the Markov chain trajectory
@@ -1,8 +1,11 @@
+import numpy as np
+
 from abc import ABC, abstractmethod
 
-from yagremcmc.chain.proposal import ProposalMethod
 from yagremcmc.chain.method.mrw import MRWProposal
 from yagremcmc.statistics.interface import CovarianceOperatorInterface
+from yagremcmc.statistics.covariance import DenseCovarianceMatrix
+from yagremcmc.statistics.estimation import WelfordCovarianceAccumulator
 
 
 class AdaptiveCovarianceMatrix(CovarianceOperatorInterface):
@@ -34,31 +37,159 @@ class AdaptiveCovarianceMatrix(CovarianceOperatorInterface):
         pass
 
 
-class AdaptiveMRWProposal(ProposalMethod):
+class HaarioCovarianceMatrix(AdaptiveCovarianceMatrix):
+    """
+    Adaptive Metropolis covariance (Haario et al., 2001). After idleSteps
+    states have been discarded, chain states are fed into a running covariance
+    estimate. Once collectionSteps states have been collected, the proposal
+    covariance is replaced every adaptionInterval steps by
+
+        (2.38^2 / D) * (sample covariance + eps * I).
+
+    If adaptionStop is set, the estimate is frozen once adaptionStop states
+    have been collected, such that the chain is Markovian from there on.
+    """
+
+    def __init__(self, initCov, idleSteps, collectionSteps, adaptionInterval,
+                 regularisationParameter, adaptionStop=None):
+
+        if collectionSteps < 2:
+            raise ValueError("Covariance estimation requires at least two "
+                             "collection steps.")
+
+        if adaptionInterval < 1:
+            raise ValueError("Adaption interval has to be positive.")
+
+        if adaptionStop is not None and adaptionStop < collectionSteps:
+            raise ValueError("Adaption cannot stop before the collection "
+                             "phase has been completed.")
+
+        super().__init__(initCov)
+
+        self._initCov = initCov
+
+        self._idleSteps = idleSteps
+        self._collectionSteps = collectionSteps
+        self._adaptionInterval = adaptionInterval
+        self._eps = regularisationParameter
+        self._adaptionStop = adaptionStop
+
+        self._scaling = 2.38**2 / initCov.dimension
+
+        self._accumulator = WelfordCovarianceAccumulator()
+        self._nProcessed = 0
+        self._nextAdaption = collectionSteps
+
+    @property
+    def accumulator(self):
+        return self._accumulator
+
+    @property
+    def initialCovariance(self):
+        return self._initCov
+
+    @property
+    def isAdapted(self):
+        return self._cov is not self._initCov
+
+    @property
+    def isFrozen(self):
+        return self._adaptionStop is not None \
+            and self._accumulator.nData >= self._adaptionStop
+
+    def update(self):
+
+        if self._chain is None:
+            raise ValueError("Adaptive covariance not associated with a chain")
+
+        if self.isFrozen:
+            return
+
+        nChain = self._chain.length
+
+        for n in range(self._nProcessed, nChain):
+
+            if n >= self._idleSteps:
+                self._accumulator.update(self._chain.trajectory[n])
+
+                if self.isFrozen:
+                    break
+
+        self._nProcessed = nChain
+
+        if self._accumulator.nData < self._nextAdaption:
+            return
+
+        # the regularised estimate is a temporary, so it is factorised in place
+        regCov = self._accumulator.covariance()
+        regCov[np.diag_indices_from(regCov)] += self._eps
+        regCov *= self._scaling
+
+        self._cov = DenseCovarianceMatrix(regCov, overwrite=True)
+
+        self._nextAdaption = self._accumulator.nData + self._adaptionInterval
 
-    def __init__(self, adaptiveCov):
+    def reset(self):
+
+        self._cov = self._initCov
+        self._accumulator.reset()
+        self._nProcessed = 0
+        self._nextAdaption = self._collectionSteps
+
+
+class AdaptiveMRWProposal(MRWProposal):
+    """
+    Random walk proposal with an adaptive covariance. With probability
+    mixtureWeight, the step is drawn from the initial covariance instead of
+    the adapted one (Roberts and Rosenthal, 2009), which keeps the proposal
+    from collapsing onto a degenerate covariance estimate.
+    """
+
+    def __init__(self, adaptiveCov, rng=None, mixtureWeight=0.):
 
         if adaptiveCov.dimension == 1:
             raise NotImplementedError(
                 "Adaptivity not implemented for scalar chains.")
 
-        super().__init__()
+        if not 0. <= mixtureWeight < 1.:
+            raise ValueError("Mixture weight has to be in [0, 1).")
+
+        super().__init__(adaptiveCov.covariance, rng)
 
         self._adaptiveCov = adaptiveCov
+        self._mixtureWeight = mixtureWeight
 
-        self._proposalMethod = MRWProposal(self._adaptiveCov.covariance)
+        self._initProposal = MRWProposal(adaptiveCov.initialCovariance, rng)
 
     @property
-    def covariance(self):
+    def adaptiveCovariance(self):
         return self._adaptiveCov
 
     def set_state(self, newState):
 
         self._adaptiveCov.update()
 
-        self._proposalMethod.covariance = self._adaptiveCov.covariance
-        self._proposalMethod.set_state(newState)
+        # the Cholesky factor is only recomputed when the adaptive covariance
+        # has been replaced, i.e. once per adaption interval
+        self.covariance = self._adaptiveCov.covariance
+
+        super().set_state(newState)
 
     def generate_proposal(self):
 
-        return self._proposalMethod.generate_proposal()
+        if self._state is None:
+            raise ValueError(
+                "Trying to generate proposal with undefined state")
+
+        if self._mixtureWeight > 0. and self._adaptiveCov.isAdapted \
+                and self._rng.uniform() < self._mixtureWeight:
+            step = self._initProposal._draw_step(self._state.dimension)
+        else:
+            step = self._draw_step(self._state.dimension)
+
+        return self._state.clone_with(self._state.coefficient + step)
+
+    def reset(self):
+
+        self._adaptiveCov.reset()
+        self.covariance = self._adaptiveCov.covariance
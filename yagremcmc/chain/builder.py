@@ -1,3 +1,5 @@
+import numpy as np
+
 from abc import ABC, abstractmethod
 
 from yagremcmc.chain.metropolisHastings import MetropolisHastings
@@ -15,6 +17,10 @@ class ChainBuilder(ABC):
         # is the default diagnostics for Markov Chains
         self._diagnostics = AcceptanceRateDiagnostics()
 
+        # random number generator of the chain. If None, the global state of
+        # numpy.random is used
+        self._rng = None
+
     @property
     def bayesModel(self):
         return self._bayesModel
@@ -39,6 +45,14 @@ class ChainBuilder(ABC):
     def diagnostics(self, diagnostics):
         self._diagnostics = diagnostics
 
+    @property
+    def rng(self):
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng):
+        self._rng = rng
+
     def validate_target_measure(self):
 
         if self._bayesModel is None and self._explicitTarget is None:
@@ -67,8 +81,47 @@ class ChainBuilder(ABC):
     def build_from_target(self) -> MetropolisHastings:
         pass
 
-    # TODO: use prototypes to be able to generate several methods from the
-    #       same builder. Currently they share states if you try this.
+    @classmethod
+    def from_prototype(cls, prototype, **overrides):
+        """
+        Create a builder with the configuration of prototype, which has to be
+        an instance of cls or of one of its base classes. Models, targets and
+        covariances are shared with the prototype. Chain diagnostics are not,
+        and a random generator of the prototype is replaced by an independent
+        one seeded from it, such that the chains draw from separate streams.
+        Without a generator, both use the global state of numpy.random.
+        Keyword arguments override properties of the prototype.
+        """
+
+        if not isinstance(prototype, ChainBuilder) \
+                or not issubclass(cls, type(prototype)):
+            raise ValueError(f"Cannot create {cls.__name__} from prototype "
+                             f"of type {type(prototype).__name__}.")
+
+        builder = cls()
+        builder.__dict__.update(vars(prototype))
+        builder._detach_from_prototype()
+
+        for name, value in overrides.items():
+
+            if not isinstance(getattr(cls, name, None), property):
+                raise ValueError(f"{cls.__name__} has no property {name}.")
+
+            setattr(builder, name, value)
+
+        return builder
+
+    def _detach_from_prototype(self):
+        """
+        Replace components that accumulate state while a chain runs.
+        """
+        self._diagnostics = type(self._diagnostics)()
+
+        # Generator.spawn requires NumPy 1.25, so the new generator is seeded
+        # with a draw from the prototype's generator instead
+        if isinstance(self._rng, np.random.Generator):
+            self._rng = np.random.default_rng(self._rng.integers(2**63))
+
     def build_method(self):
 
         self._validate_parameters()
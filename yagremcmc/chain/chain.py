@@ -1,21 +1,107 @@
-from numpy import array, sum
+import numpy as np
 
 
 class Chain:
+    """
+    Trajectory of a Markov chain, stored row-wise in a contiguous array.
+    Capacity is preallocated for the requested chain length and only grows
+    if more states are appended.
+
+    States can be thinned and burned in while they are collected: the first
+    burnIn states are discarded, of the remaining ones only every thinning-th
+    state is stored. Adaptive methods that learn from the chain only see the
+    stored states.
+    """
+
     def __init__(self):
 
-        self._trajectory = []
+        self._trajectory = None
+        self._length = 0
+
+        self._thinning = 1
+        self._burnIn = 0
+        self._nOffered = 0
 
     @property
     def trajectory(self):
-        return self._trajectory
+
+        if self._trajectory is None:
+            return np.empty((0, 0))
+
+        return self._trajectory[:self._length]
 
     @property
     def length(self):
-        return len(self._trajectory)
+        return self._length
+
+    @property
+    def thinning(self):
+        return self._thinning
+
+    @thinning.setter
+    def thinning(self, value):
+
+        if value < 1:
+            raise ValueError(f"Invalid thinning step: {value}")
+
+        self._thinning = int(value)
+
+    @property
+    def burnIn(self):
+        return self._burnIn
+
+    @burnIn.setter
+    def burnIn(self, value):
+
+        if value < 0:
+            raise ValueError(f"Invalid burn-in length: {value}")
+
+        self._burnIn = int(value)
+
+    def n_recorded(self, nSteps):
+        """
+        Number of states that are stored if nSteps states are appended to an
+        empty chain.
+        """
+
+        return max(0, -(-(nSteps - self._burnIn) // self._thinning))
+
+    def preallocate(self, nSteps, dim):
+        """
+        Allocate a fresh buffer for nSteps states of dimension dim. Previously
+        returned trajectories remain valid, as they refer to the old buffer.
+        """
+
+        buffer = np.empty((max(nSteps, self._length), dim))
+
+        if self._length > 0:
+            buffer[:self._length] = self._trajectory[:self._length]
+
+        self._trajectory = buffer
 
     def append(self, stateVector):
-        self._trajectory.append(stateVector)
+
+        offset = self._nOffered - self._burnIn
+        self._nOffered += 1
+
+        if offset < 0 or offset % self._thinning != 0:
+            return
+
+        if self._trajectory is None:
+            self.preallocate(1, np.size(stateVector))
+
+        elif self._length == self._trajectory.shape[0]:
+            self.preallocate(max(1, 2 * self._length),
+                             self._trajectory.shape[1])
+
+        self._trajectory[self._length] = stateVector
+        self._length += 1
 
     def clear(self):
-        self._trajectory = []
+        """
+        Remove all states. Thinning and burn-in settings are kept.
+        """
+
+        self._trajectory = None
+        self._length = 0
+        self._nOffered = 0
@@ -1,4 +1,4 @@
-import numpy as np
+from collections import deque
 
 from yagremcmc.chain.interface import ChainDiagnostics
 from yagremcmc.chain.transition import TransitionData
@@ -19,8 +19,14 @@ class DummyDiagnostics(ChainDiagnostics):
 class AcceptanceRateDiagnostics(ChainDiagnostics):
     def __init__(self):
 
-        self._decisions = []
+        # only the last lag decisions are kept for the rolling acceptance
+        # rate, the global one is tracked by counters
         self._lag = None
+        self._window = deque(maxlen=0)
+        self._nWindowAccepted = 0
+
+        self._nDecisions = 0
+        self._nAccepted = 0
 
     @property
     def lag(self):
@@ -33,26 +39,47 @@ class AcceptanceRateDiagnostics(ChainDiagnostics):
             raise ValueError("Lag must be a positive integer.")
         self._lag = value
 
+        self._window = deque(self._window, maxlen=value)
+        self._nWindowAccepted = sum(self._window)
+
+    @property
+    def nDecisions(self):
+        return self._nDecisions
+
     def rolling_acceptance_rate(self):
         if not self._lag:
             raise RuntimeError("Lag for rolling acceptance rate not set.")
-        if len(self._decisions) < self._lag:
+        if len(self._window) < self._lag:
             raise RuntimeError(
                 "Insufficient data for rolling acceptance rate.")
-        return np.sum(self._decisions[-self._lag:]) / self._lag
+        return self._nWindowAccepted / self._lag
 
     def global_acceptance_rate(self):
-        return np.sum(self._decisions) / \
-            len(self._decisions) if self._decisions else 0.0
+        if self._nDecisions == 0:
+            return 0.0
+        return self._nAccepted / self._nDecisions
 
-    def process(self, transition_data):
-        if transition_data.outcome == TransitionData.REJECTED:
-            self._decisions.append(0)
-        elif transition_data.outcome == TransitionData.ACCEPTED:
-            self._decisions.append(1)
-        else:
+    def record_outcome(self, outcome):
+
+        if not (outcome == TransitionData.REJECTED
+                or outcome == TransitionData.ACCEPTED):
             raise ValueError("Invalid acceptance decision.")
 
+        self._nDecisions += 1
+        self._nAccepted += outcome
+
+        if self._lag is None:
+            return
+
+        if len(self._window) == self._lag:
+            self._nWindowAccepted -= self._window[0]
+
+        self._window.append(outcome)
+        self._nWindowAccepted += outcome
+
+    def process(self, transition_data):
+        self.record_outcome(transition_data.outcome)
+
     def print_diagnostics(self, logger):
         try:
             rAccept = self.rolling_acceptance_rate()
@@ -61,7 +88,10 @@ class AcceptanceRateDiagnostics(ChainDiagnostics):
             logger.warning(f"  - Rolling acceptance rate unavailable: {e}")
 
     def reset(self):
-        self._decisions = []
+        self._window.clear()
+        self._nWindowAccepted = 0
+        self._nDecisions = 0
+        self._nAccepted = 0
 
 
 class FullDiagnostics(ChainDiagnostics):
@@ -11,7 +11,8 @@ class AdaptiveErrorModel(MLDA):
                  baseProposalCov,
                  nSteps,
                  targetDiagnostics,
-                 surrogateDiagnostics):
+                 surrogateDiagnostics,
+                 rng=None):
 
         print("CONSTRUCTING ADAPTIVE ERROR MODEL MLDA")
 
@@ -20,7 +21,8 @@ class AdaptiveErrorModel(MLDA):
                          baseProposalCov,
                          nSteps,
                          targetDiagnostics,
-                         surrogateDiagnostics)
+                         surrogateDiagnostics,
+                         rng)
 
     def _process_transition(self, transitionData):
 
@@ -79,4 +81,5 @@ class AEMBuilder(MLDABuilder):
                 raise ValueError(f"Likelihood on level {i} is not adaptive.")
 
     def build_mlda(self, tgtPost, surPost, bpc, nS, tgtD, surD):
-        return AdaptiveErrorModel(tgtPost, surPost, bpc, nS, tgtD, surD)
+        return AdaptiveErrorModel(tgtPost, surPost, bpc, nS, tgtD, surD,
+                                  self._rng)
@@ -0,0 +1,145 @@
+from yagremcmc.chain.metropolisHastings import MetropolisHastings
+from yagremcmc.chain.target import UnnormalisedPosterior
+from yagremcmc.chain.builder import ChainBuilder
+from yagremcmc.chain.adaptive import (HaarioCovarianceMatrix,
+                                      AdaptiveMRWProposal)
+
+
+class AdaptiveMetropolisedRandomWalk(MetropolisHastings):
+    """
+    Metropolised random walk whose proposal covariance is adapted online to
+    the covariance of the chain, see HaarioCovarianceMatrix and
+    AdaptiveMRWProposal.
+    """
+
+    def __init__(self, targetDensity, initCov, idleSteps, collectionSteps,
+                 adaptionInterval, regularisationParameter, diagnostics,
+                 rng=None, mixtureWeight=0., adaptionStop=None):
+
+        adaptiveCov = HaarioCovarianceMatrix(
+            initCov, idleSteps, collectionSteps, adaptionInterval,
+            regularisationParameter, adaptionStop)
+
+        proposalMethod = AdaptiveMRWProposal(adaptiveCov, rng, mixtureWeight)
+
+        super().__init__(targetDensity, proposalMethod, diagnostics, rng)
+
+        adaptiveCov.set_chain(self._chain)
+
+    @property
+    def proposalCovariance(self):
+        return self._proposalMethod.covariance
+
+    def _log_acceptance_ratio(self, proposal, state):
+
+        # proposal is symmetric
+        return self._log_density_ratio(proposal, state)
+
+    def run(self, chainLength, initialState, verbose=True):
+
+        self._proposalMethod.reset()
+        super().run(chainLength, initialState, verbose)
+
+
+class AdaptiveMRWBuilder(ChainBuilder):
+
+    def __init__(self):
+
+        super().__init__()
+
+        self._initCov = None
+        self._idleSteps = 0
+        self._collectionSteps = None
+        self._adaptionInterval = 20
+        self._regParam = 1e-6
+        self._mixtureWeight = 0.
+        self._adaptionStop = None
+
+    @property
+    def initialCovariance(self):
+        return self._initCov
+
+    @initialCovariance.setter
+    def initialCovariance(self, cov):
+        self._initCov = cov
+
+    @property
+    def idleSteps(self):
+        return self._idleSteps
+
+    @idleSteps.setter
+    def idleSteps(self, iSteps):
+        self._idleSteps = iSteps
+
+    @property
+    def collectionSteps(self):
+        return self._collectionSteps
+
+    @collectionSteps.setter
+    def collectionSteps(self, cSteps):
+        self._collectionSteps = cSteps
+
+    @property
+    def adaptionInterval(self):
+        return self._adaptionInterval
+
+    @adaptionInterval.setter
+    def adaptionInterval(self, nSteps):
+        self._adaptionInterval = nSteps
+
+    @property
+    def regularisationParameter(self):
+        return self._regParam
+
+    @regularisationParameter.setter
+    def regularisationParameter(self, eps):
+        self._regParam = eps
+
+    @property
+    def mixtureWeight(self):
+        return self._mixtureWeight
+
+    @mixtureWeight.setter
+    def mixtureWeight(self, beta):
+        self._mixtureWeight = beta
+
+    @property
+    def adaptionStop(self):
+        return self._adaptionStop
+
+    @adaptionStop.setter
+    def adaptionStop(self, nSteps):
+        self._adaptionStop = nSteps
+
+    def build_from_model(self) -> MetropolisHastings:
+
+        targetDensity = UnnormalisedPosterior(
+            self._bayesModel.likelihood, self._bayesModel.prior)
+
+        return self._build(targetDensity)
+
+    def build_from_target(self) -> MetropolisHastings:
+        return self._build(self._explicitTarget)
+
+    def _build(self, targetDensity):
+
+        return AdaptiveMetropolisedRandomWalk(
+            targetDensity, self._initCov, self._idleSteps,
+            self._collectionSteps, self._adaptionInterval, self._regParam,
+            self._diagnostics, self._rng, self._mixtureWeight,
+            self._adaptionStop)
+
+    def _validate_parameters(self) -> None:
+
+        if self._initCov is None:
+            raise ValueError("Initial covariance not set for adaptive MRW")
+
+        if self._collectionSteps is None:
+            raise ValueError("Number of collection steps not set for "
+                             "adaptive MRW")
+
+        if self._regParam < 0.:
+            raise ValueError("Regularisation parameter must be non-negative")
+
+        if not 0. <= self._mixtureWeight < 1.:
+            raise ValueError("Mixture weight must lie in [0, 1)")
@@ -156,10 +156,9 @@ class AdaptiveMetropolis(MetropolisHastings):
         super().__init__(targetDensity, proposalMethod)
         self._proposalMethod.chain = self._chain
 
-    def _acceptance_probability(self, proposal, state):
-        densityRatio = np.exp(self._tgtDensity.evaluate_log(proposal)
-                              - self._tgtDensity.evaluate_log(state))
-        return min(densityRatio, 1.)
+    def _log_acceptance_ratio(self, proposal, state):
+        return self._tgtDensity.evaluate_log(proposal) \
+            - self._tgtDensity.evaluate_log(state)
 
 
 class AMBuilder(ChainBuilder):
@@ -115,12 +115,10 @@ class AdaptiveWeightingMetropolis(MetropolisHastings):
 
         self._proposalMethod.covariance.set_chain(self._chain)
 
-    def _acceptance_probability(self, proposal, state):
+    def _log_acceptance_ratio(self, proposal, state):
 
-        densityRatio = np.exp(self._tgtDensity.evaluate_log(proposal)
-                              - self._tgtDensity.evaluate_log(state))
-
-        return np.min([densityRatio, 1.])
+        return self._tgtDensity.evaluate_log(proposal) \
+            - self._tgtDensity.evaluate_log(state)
 
 
 class AWMBuilder(ChainBuilder):
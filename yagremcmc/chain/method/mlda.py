@@ -1,5 +1,3 @@
-from numpy import exp
-
 from yagremcmc.chain.proposal import ProposalMethod
 from yagremcmc.chain.metropolisHastings import MetropolisHastings
 from yagremcmc.chain.method.mrw import MetropolisedRandomWalk
@@ -11,13 +9,14 @@ from yagremcmc.utility.hierarchy import Hierarchy
 
 class SurrogateTransition(MetropolisHastings, ProposalMethod):
 
-    def __init__(self, targetDensity, proposalMethod, diagnostics, nSteps):
+    def __init__(self, targetDensity, proposalMethod, diagnostics, nSteps,
+                 rng=None):
 
         if not isinstance(proposalMethod, MetropolisHastings):
             raise ValueError("Proposal method of surrogate transition needs"
                              " to be derived from MetropolisHastings")
 
-        super().__init__(targetDensity, proposalMethod, diagnostics)
+        super().__init__(targetDensity, proposalMethod, diagnostics, rng)
         self._chainLength = nSteps + 1
 
     def generate_proposal(self):
@@ -32,20 +31,18 @@ class SurrogateTransition(MetropolisHastings, ProposalMethod):
 
         return self._stateType(self._proposalMethod.chain.trajectory[-1])
 
-    def _acceptance_probability(self, proposal, state):
-
-        ratio = exp(
-            self._tgtDensity.evaluate_log(proposal) +
-            self._proposalMethod.target.evaluate_log(state) -
-            self._proposalMethod.target.evaluate_log(proposal) -
-            self._tgtDensity.evaluate_log(state))
+    def _log_acceptance_ratio(self, proposal, state):
 
-        return ratio if ratio < 1. else 1.
+        return self._tgtDensity.evaluate_log(proposal) \
+            + self._proposalMethod.target.evaluate_log(state) \
+            - self._proposalMethod.target.evaluate_log(proposal) \
+            - self._tgtDensity.evaluate_log(state)
 
 
 class SurrogateHierarchy(Hierarchy):
 
-    def __init__(self, tgtMeasures, diagnosticsList, basePropCov, nSteps):
+    def __init__(self, tgtMeasures, diagnosticsList, basePropCov, nSteps,
+                 rng=None):
 
         nLevels = len(tgtMeasures)
 
@@ -61,14 +58,16 @@ class SurrogateHierarchy(Hierarchy):
             MetropolisedRandomWalk(
                 tgtMeasures[0],
                 basePropCov,
-                diagnosticsList[0])]
+                diagnosticsList[0],
+                rng)]
 
         for level in range(1, nLevels):
             hierarchy.append(SurrogateTransition(
                 tgtMeasures[level],
                 hierarchy[level - 1],
                 diagnosticsList[level],
-                nSteps[level]))
+                nSteps[level],
+                rng))
 
         super().__init__(hierarchy)
 
@@ -79,10 +78,11 @@ class MLDAProposal(ProposalMethod):
     """
 
     def __init__(self, surrogateTargets, surrogateDiagnostics,
-                 baseProposalCov, nSteps):
+                 baseProposalCov, nSteps, rng=None):
 
         self._surrogateHierarchy = SurrogateHierarchy(
-            surrogateTargets, surrogateDiagnostics, baseProposalCov, nSteps)
+            surrogateTargets, surrogateDiagnostics, baseProposalCov, nSteps,
+            rng)
 
         self._baseChainLength = nSteps[0] + 1
 
@@ -121,7 +121,7 @@ class MLDA(MetropolisHastings):
 
     def __init__(
             self, targetDensity, surrogateDensities, baseProposalCov, nSteps,
-            targetDiagnostics, surrogateDiagnosticsList):
+            targetDiagnostics, surrogateDiagnosticsList, rng=None):
 
         print("CONSTRUCTING VANILLA MLDA")
 
@@ -131,10 +131,11 @@ class MLDA(MetropolisHastings):
             surrogateDensities,
             surrogateDiagnosticsList,
             baseProposalCov,
-            nSteps
+            nSteps,
+            rng
         )
 
-        super().__init__(targetDensity, proposal, targetDiagnostics)
+        super().__init__(targetDensity, proposal, targetDiagnostics, rng)
 
     @property
     def nSurrogates(self):
@@ -143,15 +144,12 @@ class MLDA(MetropolisHastings):
     def surrogate(self, sIdx):
         return self._proposalMethod.surrogate(sIdx)
 
-    def _acceptance_probability(self, proposal, state):
+    def _log_acceptance_ratio(self, proposal, state):
 
-        ratio = exp(
-            self._tgtDensity.evaluate_log(proposal) +
-            self._finestTarget.evaluate_log(state) -
-            self._finestTarget.evaluate_log(proposal) -
-            self._tgtDensity.evaluate_log(state))
-
-        return ratio if ratio < 1. else 1.
+        return self._tgtDensity.evaluate_log(proposal) \
+            + self._finestTarget.evaluate_log(state) \
+            - self._finestTarget.evaluate_log(proposal) \
+            - self._tgtDensity.evaluate_log(state)
 
 
 class MLDABuilder(ChainBuilder):
@@ -268,6 +266,21 @@ class MLDABuilder(ChainBuilder):
 
         return
 
+    def _detach_from_prototype(self):
+
+        super()._detach_from_prototype()
+
+        if self._tgtDgnst is not None:
+            self._tgtDgnst = type(self._tgtDgnst)()
+
+        if self._surrDgnstList is not None:
+            self._surrDgnstList = [type(dgnstc)()
+                                   for dgnstc in self._surrDgnstList]
+
+        # surrogate targets are wrapped in place by a bias correction
+        if self._surrTgts is not None:
+            self._surrTgts = list(self._surrTgts)
+
     def create_diagnostics(self, nSurrogates):
 
         if self._tgtDgnst is None:
@@ -310,7 +323,7 @@ class MLDABuilder(ChainBuilder):
                     tgt, self._biasCorrection[idx])
 
     def build_mlda(self, tgtPost, surPost, bpc, nS, tgtD, surD):
-        return MLDA(tgtPost, surPost, bpc, nS, tgtD, surD)
+        return MLDA(tgtPost, surPost, bpc, nS, tgtD, surD, self._rng)
 
     def build_from_model(self):
 
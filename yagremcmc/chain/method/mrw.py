@@ -1,20 +1,30 @@
-from numpy import exp
+import numpy as np
+
 from yagremcmc.chain.proposal import ProposalMethod
 from yagremcmc.chain.metropolisHastings import MetropolisHastings
 from yagremcmc.chain.target import UnnormalisedPosterior
 from yagremcmc.chain.builder import ChainBuilder
-from yagremcmc.statistics.gaussian import Gaussian
+from yagremcmc.statistics.covariance import (DiagonalCovarianceMatrix,
+                                             IIDCovarianceMatrix,
+                                             DenseCovarianceMatrix)
 
 
 class MRWProposal(ProposalMethod):
 
-    def __init__(self, proposalCov):
+    # number of white noise entries drawn from the generator at once
+    _noiseBlockEntries = 2**14
+
+    def __init__(self, proposalCov, rng=None):
 
         super().__init__()
 
-        self._cov = proposalCov
+        self._rng = np.random if rng is None else rng
 
-        self.proposalLaw_ = None
+        self._whiteNoise = None
+        self._noiseIdx = 0
+
+        self._cov = None
+        self.covariance = proposalCov
 
     @property
     def covariance(self):
@@ -22,12 +32,27 @@ class MRWProposal(ProposalMethod):
 
     @covariance.setter
     def covariance(self, cov):
-        self._cov = cov
 
-    def set_state(self, newState):
+        # adaptive proposals reassign their covariance in every step
+        if cov is self._cov:
+            return
 
-        self._state = newState
-        self.proposalLaw_ = Gaussian(self._state, self._cov)
+        self._cov = cov
+
+        # the proposal covariance is fixed between updates, so diagonal
+        # covariances are reduced to their standard deviations and dense
+        # ones to their Cholesky factor once. An array is used also for
+        # i.i.d. components, since NumPy multiplies small arrays
+        # elementwise faster than by a scalar
+        if isinstance(cov, IIDCovarianceMatrix):
+            self._stdDev = np.full(cov.dimension, np.sqrt(cov.variance))
+        elif isinstance(cov, DiagonalCovarianceMatrix):
+            self._stdDev = np.sqrt(cov.marginalVariance)
+        else:
+            self._stdDev = None
+
+        self._cholFactor = cov.cholFactor_ \
+            if isinstance(cov, DenseCovarianceMatrix) else None
 
     def generate_proposal(self):
 
@@ -35,26 +60,52 @@ class MRWProposal(ProposalMethod):
             raise ValueError(
                 "Trying to generate proposal with undefined state")
 
-        return self.proposalLaw_.generate_realisation()
+        step = self._draw_step(self._state.dimension)
+
+        return self._state.clone_with(self._state.coefficient + step)
+
+    def _draw_step(self, dimension):
+
+        xi = self._white_noise(dimension)
+
+        if self._stdDev is not None:
+            return self._stdDev * xi
+        elif self._cholFactor is not None:
+            return self._cholFactor @ xi
+        else:
+            return self._cov.apply_chol_factor(xi)
+
+    def _white_noise(self, dimension):
+
+        # standard normal samples are drawn in blocks, which amortises the
+        # overhead of calling into the generator in every step
+        if self._whiteNoise is None or self._whiteNoise.shape[1] != dimension \
+                or self._noiseIdx == self._whiteNoise.shape[0]:
+
+            nRows = max(1, self._noiseBlockEntries // dimension)
+            self._whiteNoise = self._rng.standard_normal((nRows, dimension))
+            self._noiseIdx = 0
+
+        xi = self._whiteNoise[self._noiseIdx]
+        self._noiseIdx += 1
+
+        return xi
 
 
 class MetropolisedRandomWalk(MetropolisHastings):
 
-    def __init__(self, targetDensity, proposalCov, diagnostics):
+    def __init__(self, targetDensity, proposalCov, diagnostics, rng=None):
 
         print("CONSTRUCTING METROPOLISED RANDOM WALK")
 
-        proposalMethod = MRWProposal(proposalCov)
+        proposalMethod = MRWProposal(proposalCov, rng)
 
-        super().__init__(targetDensity, proposalMethod, diagnostics)
+        super().__init__(targetDensity, proposalMethod, diagnostics, rng)
 
-    def _acceptance_probability(self, proposal, state):
+    def _log_acceptance_ratio(self, proposal, state):
 
         # proposal is symmetric
-        densityRatio = exp(self._tgtDensity.evaluate_log(proposal)
-                           - self._tgtDensity.evaluate_log(state))
-
-        return densityRatio if densityRatio < 1. else 1.
+        return self._log_density_ratio(proposal, state)
 
 
 class MRWBuilder(ChainBuilder):
@@ -78,12 +129,13 @@ class MRWBuilder(ChainBuilder):
             self._bayesModel.likelihood, self._bayesModel.prior)
 
         return MetropolisedRandomWalk(
-            targetDensity, self._proposalCov, self._diagnostics)
+            targetDensity, self._proposalCov, self._diagnostics, self._rng)
 
     def build_from_target(self) -> MetropolisHastings:
 
         return MetropolisedRandomWalk(
-            self._explicitTarget, self._proposalCov, self._diagnostics)
+            self._explicitTarget, self._proposalCov, self._diagnostics,
+            self._rng)
 
     def _validate_parameters(self) -> None:
 
@@ -1,4 +1,4 @@
-from numpy import zeros, sqrt, exp
+from numpy import zeros, sqrt
 
 from yagremcmc.chain.proposal import ProposalMethod
 from yagremcmc.chain.metropolisHastings import MetropolisHastings
@@ -8,7 +8,7 @@ from yagremcmc.statistics.gaussian import Gaussian
 
 class PCNProposal(ProposalMethod):
 
-    def __init__(self, prior, stepSize):
+    def __init__(self, prior, stepSize, rng=None):
 
         if not isinstance(prior, Gaussian):
             raise NotImplementedError("PCN only supports Gaussian priors")
@@ -17,6 +17,7 @@ class PCNProposal(ProposalMethod):
 
         self.prior_ = prior
         self._stepSize = stepSize
+        self._rng = rng
 
         self.proposalLaw_ = None
 
@@ -26,7 +27,7 @@ class PCNProposal(ProposalMethod):
             raise ValueError(
                 "Trying to generate proposal with undefined state")
 
-        xi = self.prior_.generate_realisation()
+        xi = self.prior_.generate_realisation(self._rng)
 
         t = 2. * self._stepSize
         ParamType = type(self._state)
@@ -37,7 +38,8 @@ class PCNProposal(ProposalMethod):
 
 class PreconditionedCrankNicolson(MetropolisHastings):
 
-    def __init__(self, targetDensity, prior, stepSize, diagnostics):
+    def __init__(self, targetDensity, prior, stepSize, diagnostics,
+                 rng=None):
 
         assert 0 < stepSize and stepSize <= 0.5
 
@@ -45,16 +47,14 @@ class PreconditionedCrankNicolson(MetropolisHastings):
             raise ValueError("Preconditioned Crank Nicholson requires "
                              + "centred prior")
 
-        proposalMethod = PCNProposal(prior, stepSize)
+        proposalMethod = PCNProposal(prior, stepSize, rng)
 
-        super().__init__(targetDensity, proposalMethod, diagnostics)
+        super().__init__(targetDensity, proposalMethod, diagnostics, rng)
 
-    def _acceptance_probability(self, proposal, state):
+    def _log_acceptance_ratio(self, proposal, state):
 
-        lRatio = exp(self._tgtDensity.evaluate_log(proposal)
-                     - self._tgtDensity.evaluate_log(state))
-
-        return lRatio if lRatio < 1. else 1.
+        # the proposal is reversible with respect to the prior
+        return self._log_density_ratio(proposal, state)
 
 
 class PCNBuilder(ChainBuilder):
@@ -75,7 +75,8 @@ class PCNBuilder(ChainBuilder):
     def build_from_model(self) -> MetropolisHastings:
 
         return PreconditionedCrankNicolson(
-            self._bayesModel.likelihood, self._bayesModel.prior, self._stepSize, self._diagnostics)
+            self._bayesModel.likelihood, self._bayesModel.prior, self._stepSize,
+            self._diagnostics, self._rng)
 
     def build_from_target(self) -> MetropolisHastings:
 
@@ -1,5 +1,7 @@
+import numpy as np
+
+from math import exp, isnan
 from abc import ABC, abstractmethod
-from numpy.random import uniform
 
 from yagremcmc.statistics.interface import DensityInterface
 from yagremcmc.chain.interface import ChainDiagnostics
@@ -17,8 +19,13 @@ class MetropolisHastings(ABC):
     def __init__(self,
                  targetDensity: DensityInterface,
                  proposalMethod: ProposalMethod,
-                 diagnostics: ChainDiagnostics
+                 diagnostics: ChainDiagnostics,
+                 rng=None
                  ) -> None:
+        """
+        rng is a numpy.random.Generator. If it is not provided, random numbers
+        are drawn from the global state of numpy.random.
+        """
 
         super().__init__()
 
@@ -26,6 +33,13 @@ class MetropolisHastings(ABC):
         self._proposalMethod = proposalMethod
         self._diagnostics = diagnostics
 
+        self._rng = np.random if rng is None else rng
+
+        # (state, log target density) pairs of the current state and the
+        # latest proposal. The target is assumed to be fixed during a run.
+        self._stateLogDensity = None
+        self._proposalLogDensity = None
+
         self._chain = Chain()
         self._verbosityController = VerbosityController()
 
@@ -49,25 +63,59 @@ class MetropolisHastings(ABC):
             self._verbosityController.turn_off()
 
     @abstractmethod
-    def _acceptance_probability(self, proposal, state):
+    def _log_acceptance_ratio(self, proposal, state):
+        """
+        Logarithm of the Metropolis-Hastings ratio, which may be positive.
+        """
         pass
 
+    def _acceptance_probability(self, proposal, state):
+
+        logRatio = self._log_acceptance_ratio(proposal, state)
+
+        if logRatio >= 0.:
+            return 1.
+
+        return exp(logRatio)
+
+    def _log_density_ratio(self, proposal, state):
+        """
+        Log ratio of the target densities of proposal and state. The log
+        density of the state is kept from the previous step if it was
+        evaluated for the same state object, such that only the proposal
+        requires a new evaluation.
+        """
+
+        if self._stateLogDensity is None or \
+                self._stateLogDensity[0] is not state:
+            self._stateLogDensity = \
+                (state, self._tgtDensity.evaluate_log(state))
+
+        proposalLogDensity = self._tgtDensity.evaluate_log(proposal)
+        self._proposalLogDensity = (proposal, proposalLogDensity)
+
+        return proposalLogDensity - self._stateLogDensity[1]
+
     def _accept_reject(self, proposal, state) -> TransitionData:
 
         # acceptance probability is zero, omit evaluation of the likelihood
-        # in __acceptance_probability. The probability of this happening is
+        # in _log_acceptance_ratio. The probability of this happening is
         # non-zero in MLDA
         if proposal == state:
             return TransitionData(state, proposal, TransitionData.REJECTED)
 
-        acceptProb = self._acceptance_probability(proposal, state)
+        logRatio = self._log_acceptance_ratio(proposal, state)
 
-        if acceptProb < 0. or 1. < acceptProb:
-            raise RuntimeError(f"invalid acceptance probability: {acceptProb}")
+        if isnan(logRatio):
+            raise RuntimeError(f"invalid log acceptance ratio: {logRatio}")
 
-        decision = uniform(low=0., high=1., size=1)[0]
+        # certain acceptance does not require a random decision
+        if logRatio >= 0.:
+            return TransitionData(state, proposal, TransitionData.ACCEPTED)
 
-        if decision <= acceptProb:
+        # the decision is taken in log-space: the logarithm of a uniform
+        # random variable is a negative standard exponential one
+        if -self._rng.standard_exponential() <= logRatio:
             return TransitionData(state, proposal, TransitionData.ACCEPTED)
         else:
             return TransitionData(state, proposal, TransitionData.REJECTED)
@@ -95,6 +143,9 @@ class MetropolisHastings(ABC):
 
         self._diagnostics.process(transitionData)
 
+        if transitionData.outcome == TransitionData.ACCEPTED:
+            self._stateLogDensity = self._proposalLogDensity
+
         nextState = self.determine_next_state(transitionData)
         self._update_chain(nextState)
 
@@ -104,10 +155,15 @@ class MetropolisHastings(ABC):
 
         self.set_up_verbosity_controller(chainLength, verbose)
 
+        self._stateLogDensity = None
+        self._proposalLogDensity = None
+
         self._chain.clear()
+        self._chain.preallocate(self._chain.n_recorded(chainLength),
+                                initialState.dimension)
         self._chain.append(initialState.coefficient)
 
-        state = initialState.clone_with(self._chain.trajectory[0])
+        state = initialState
 
         for n in range(chainLength - 1):
 
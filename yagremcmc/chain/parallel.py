@@ -0,0 +1,75 @@
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _run_chain(builder, nSteps, initState, seedSequence):
+    """
+    Build and run a single chain inside a worker process. The chain is
+    constructed from the builder in the worker, such that no chain or solver
+    state has to be transferred between processes.
+    """
+
+    builder.rng = np.random.default_rng(seedSequence)
+
+    mcmc = builder.build_method()
+    mcmc.run(nSteps, initState, verbose=False)
+
+    return mcmc.chain.trajectory, mcmc.diagnostics
+
+
+def run_chains_parallel(builder, nChains, nSteps, initStates, seed=None,
+                        maxWorkers=None):
+    """
+    Run independent Markov chains of the same method in separate processes.
+
+    Parameters
+    ----------
+    builder : ChainBuilder
+        Fully configured builder. Each worker receives a copy and builds its
+        own chain from it.
+    nChains : int
+        Number of independent chains.
+    nSteps : int
+        Length of each chain.
+    initStates : ParameterInterface or list of ParameterInterface
+        Initial state shared by all chains, or one initial state per chain.
+    seed : int or np.random.SeedSequence, optional
+        Root seed. Every chain draws its random numbers from a generator
+        seeded with a distinct child of np.random.SeedSequence(seed). A
+        generator set in the builder is replaced by it.
+    maxWorkers : int, optional
+        Maximum number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    trajectories : np.ndarray
+        Array of shape (nChains, nSteps, dim) holding the chain trajectories.
+    diagnostics : list
+        The chain diagnostics of each chain.
+    """
+
+    if nChains < 1:
+        raise ValueError(f"Trying to run {nChains} chains.")
+
+    if isinstance(initStates, (list, tuple)):
+        if not len(initStates) == nChains:
+            raise ValueError("Number of initial states does not match the "
+                             "number of chains.")
+    else:
+        initStates = [initStates] * nChains
+
+    seedSequences = np.random.SeedSequence(seed).spawn(nChains)
+
+    with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+
+        futures = [executor.submit(_run_chain, builder, nSteps, initStates[i],
+                                   seedSequences[i])
+                   for i in range(nChains)]
+
+        results = [future.result() for future in futures]
+
+    trajectories = np.stack([result[0] for result in results])
+    diagnostics = [result[1] for result in results]
+
+    return trajectories, diagnostics
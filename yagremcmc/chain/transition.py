@@ -3,6 +3,8 @@ class TransitionData:
     REJECTED = 0
     ACCEPTED = 1
 
+    __slots__ = ('_state', '_proposal', '_outcome')
+
     def __init__(self, state, proposal, outcome):
 
         if not outcome in [TransitionData.REJECTED, TransitionData.ACCEPTED]:
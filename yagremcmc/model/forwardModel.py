@@ -1,19 +1,44 @@
 from yagremcmc.model.evaluation import EvaluationStatus
+from yagremcmc.utility.memoisation import ForwardModelCache
 
 
 class ForwardModel:
 
-    def __init__(self, solver):
+    def __init__(self, solver, cacheSize=0):
+        """
+        If cacheSize is positive, the most recent evaluations are memoised,
+        such that revisited parameters do not trigger another solver call.
+        """
 
         self.solver_ = solver
 
+        self._evalCache = None if cacheSize == 0 \
+            else ForwardModelCache(cacheSize)
+
+    @property
+    def evaluationCache(self):
+        return self._evalCache
+
+    def clear_cache(self):
+
+        if self._evalCache is not None:
+            self._evalCache.clear()
+
     def evaluate(self, parameter):
 
+        if self._evalCache is not None \
+                and self._evalCache.contains(parameter):
+            return self._evalCache.retrieve(parameter)
+
         self.solver_.interpolate(parameter)
         self.solver_.invoke()
 
         if (self.solver_.status == EvaluationStatus.SUCCESS):
-            return self.solver_.evaluation
+
+            if self._evalCache is None:
+                return self.solver_.evaluation
+
+            return self._evalCache.add(parameter, self.solver_.evaluation)
 
         else:
             raise Exception("Evaluation request failed.")
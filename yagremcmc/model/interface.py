@@ -33,6 +33,10 @@ class SolverInterface(ABC):
         """
         Retrieve the result of the last evaluation performed by the solver.
 
+        The result may be a read-only view of a buffer that is overwritten
+        by the next call to invoke. Callers that keep evaluations across
+        invocations have to copy them.
+
         Returns:
             Any: The result of the solver's evaluation. The type of the result
                  is model-dependent
@@ -7,6 +7,8 @@ class ParameterInterface(ABC):
     implementation represents a parameter with a given, fixed coefficient.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def dimension(self):
@@ -4,9 +4,19 @@ from yagremcmc.parameter.interface import ParameterInterface
 
 class ParameterVector(ParameterInterface):
 
+    # a parameter is created in every step of a chain, slots make this cheaper
+    __slots__ = ('coefficient_', 'dim_', 'coefficientType_')
+
     def __init__(self, coefficient):
 
-        self.coefficient_ = coefficient
+        # store a read-only view, such that parameters can be shared between
+        # chains and caches. Writable input is copied first, as the caller
+        # could otherwise still change the coefficient through its array.
+        if coefficient.flags.writeable:
+            coefficient = coefficient.copy()
+
+        self.coefficient_ = coefficient.view()
+        self.coefficient_.setflags(write=False)
 
         self.dim_ = coefficient.size
         self.coefficientType_ = type(coefficient)
@@ -25,7 +35,7 @@ class ParameterVector(ParameterInterface):
 
     @property
     def coefficient_type(self):
-        return self.coeffType_
+        return self.coefficientType_
 
     @property
     def coefficient(self):
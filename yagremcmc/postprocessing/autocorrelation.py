@@ -1,5 +1,42 @@
 import numpy as np
-from scipy.signal import correlate
+from scipy.fft import rfft, irfft, next_fast_len
+
+
+def _autocorrelation_functions(sequences):
+    """
+    Estimate the autocorrelation functions of all columns of a 2D array in a
+    single batched real FFT. The sequences are zero-padded to a fast FFT length
+    of at least 2n - 1, such that the circular correlation coincides with the
+    linear one.
+
+    Parameters
+    ----------
+    sequences : np.ndarray
+        Array of shape (n, d), holding d sequences of length n.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n, d) holding the normalised autocorrelation functions.
+    """
+
+    if sequences.ndim != 2:
+        raise ValueError("Sequences must be given as columns of a 2D array.")
+
+    n = sequences.shape[0]
+    nFFT = next_fast_len(2 * n - 1, real=True)
+
+    # the transforms run along contiguous rows, which is faster than strided
+    # transforms along the columns of a C-ordered array
+    centred = np.ascontiguousarray((sequences - np.mean(sequences, axis=0)).T)
+
+    spectrum = rfft(centred, n=nFFT, axis=1, workers=-1)
+    powerSpectrum = np.square(spectrum.real) + np.square(spectrum.imag)
+
+    acf = irfft(powerSpectrum, n=nFFT, axis=1, workers=-1)[:, :n]
+    acf /= acf[:, :1]
+
+    return acf.T
 
 
 def estimate_autocorrelation_function_1d(sequence):
@@ -10,6 +47,7 @@ def estimate_autocorrelation_function_1d(sequence):
     ----------
     sequence : list or np.ndarray
         The input sequence for which the autocorrelation function is estimated.
+        Trajectories of a single component, of shape (n, 1), are accepted.
 
     Returns
     -------
@@ -17,16 +55,44 @@ def estimate_autocorrelation_function_1d(sequence):
         The smoothed autocorrelation function.
     """
 
-    n = len(sequence)
+    sequence = np.asarray(sequence, dtype=float)
+
+    if sequence.ndim == 2 and sequence.shape[1] == 1:
+        sequence = sequence[:, 0]
+
+    if sequence.ndim != 1:
+        raise ValueError("Input sequence must be one-dimensional.")
+
+    return _autocorrelation_functions(sequence[:, np.newaxis])[:, 0]
+
+
+def estimate_autocorrelation_function_nd(sequences, axis=0):
+    """
+    Estimate the autocorrelation functions of several sequences at once,
+    using a single batched FFT.
+
+    Parameters
+    ----------
+    sequences : list or np.ndarray
+        2D array holding one sequence per column (axis=0) or per row
+        (axis=1).
+    axis : int, optional
+        The axis along which the sequences are ordered. Default is 0.
+
+    Returns
+    -------
+    np.ndarray
+        The autocorrelation functions, with the same shape as sequences.
+    """
 
-    # center the sequence
-    sequence = np.array(sequence) - np.mean(sequence)
+    sequences = np.asarray(sequences, dtype=float)
 
-    # compute covariances and omit 'negative lags'
-    acf = correlate(sequence, sequence, mode='full', method='auto')[n - 1:]
-    acf /= acf[0]
+    if sequences.ndim != 2:
+        raise ValueError("Input sequences must be given as a 2D array.")
 
-    return acf
+    acfs = _autocorrelation_functions(np.moveaxis(sequences, axis, 0))
+
+    return np.moveaxis(acfs, 0, axis)
 
 
 def sokal_heuristic(iatSeq, heuristicConst):
@@ -104,8 +170,7 @@ def integrated_autocorrelation(seq, method='mean', sokalConst=5.):
             - 'mean': Compute the IAT for the mean across all dimensions.
             - 'max': Compute the IAT for each dimension individually and
               return the largest value.
-        The 'max' option is more computationally expensive for high-dimensional
-        sequences. Default is 'mean'.
+        Default is 'mean'.
 
     sokalConst : float, optional
         A heuristic constant used to determine the maximum lag to consider
@@ -130,11 +195,44 @@ def integrated_autocorrelation(seq, method='mean', sokalConst=5.):
 
     elif method == 'max':
 
-        dim = seq.shape[1]
-        iatList = [integrated_autocorrelation_1d(
-            estimate_autocorrelation_function_1d(seq[:, d]))
-            for d in range(dim)]
+        # autocorrelation functions of all components in one batched FFT
+        acfs = estimate_autocorrelation_function_nd(seq)
+        iatList = [integrated_autocorrelation_1d(acf) for acf in acfs.T]
 
         return max(iatList)
     else:
         raise RuntimeError("undefined IAT estimation method")
+
+
+def mean_and_max_integrated_autocorrelation(seq, sokalConst=5.):
+    """
+    Estimate both the 'mean' and the 'max' IAT of integrated_autocorrelation.
+    The autocorrelation functions of the componentwise mean and of all
+    components are computed in a single batched FFT.
+
+    Parameters
+    ----------
+    seq : list of np.ndarray or np.ndarray
+        The states of a d-dimensional sequence.
+    sokalConst : float, optional
+        A heuristic constant used to determine the maximum lag to consider
+        when estimating the IAT. Default is 5.0.
+
+    Returns
+    -------
+    meanIAT : int
+        The IAT of the mean across all dimensions.
+    maxIAT : int
+        The largest IAT of the individual components.
+    """
+
+    seq = np.asarray(seq, dtype=float)
+
+    acfs = _autocorrelation_functions(
+        np.column_stack((np.mean(seq, axis=1), seq)))
+
+    meanIAT = integrated_autocorrelation_1d(acfs[:, 0], sokalConst)
+    maxIAT = max(integrated_autocorrelation_1d(acf, sokalConst)
+                 for acf in acfs[:, 1:].T)
+
+    return meanIAT, maxIAT
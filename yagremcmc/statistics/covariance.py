@@ -1,7 +1,8 @@
 import numpy as np
 
 from abc import abstractmethod
-from scipy.linalg import cholesky, solve_triangular
+from scipy.linalg import cholesky, cho_solve, LinAlgError
+from scipy.linalg.lapack import dtrtrs
 from yagremcmc.statistics.interface import CovarianceOperatorInterface
 
 
@@ -17,9 +18,16 @@ class CovarianceMatrix(CovarianceOperatorInterface):
         pass
 
     def induced_norm_squared(self, x):
+        """
+        Squared norm induced by the precision operator. If x is a 2D array,
+        its rows are interpreted as vectors and one value per row is returned.
+        """
 
-        Px = self.apply_inverse(x)
-        return np.dot(x, Px)
+        if np.ndim(x) == 1:
+            return np.dot(x, self.apply_inverse(x))
+
+        Px = self.apply_inverse(x.T).T
+        return np.einsum('ij,ij->i', x, Px)
 
 
 class DiagonalCovarianceMatrix(CovarianceMatrix):
@@ -28,54 +36,127 @@ class DiagonalCovarianceMatrix(CovarianceMatrix):
 
     Instance Attributes
     -------------------
+    _margVar : numpy.ndarray
+        One-dimensional array storing the diagonal entries of the (diagonal)
+        covariance matrix
+    _stdDev : numpy.ndarray
+        Square roots of the diagonal entries
     _precision : numpy.ndarray
-        One-dimensional array storing the reciprocals of the diagonal entries of
-        the (diagonal) covariance matrix
+        Reciprocals of the diagonal entries
     """
 
     def __init__(self, marginalVariances):
-        self._precision = np.reciprocal(marginalVariances)
+        self.marginalVariance = marginalVariances
 
     @property
     def marginalVariance(self):
-        return np.reciprocal(self._precision)
+
+        # a read-only view keeps the cached standard deviations and precision
+        # consistent. Changes have to go through the setter
+        mVar = self._margVar.view()
+        mVar.setflags(write=False)
+
+        return mVar
 
     @marginalVariance.setter
     def marginalVariance(self, mVar):
-        self._precision = np.reciprocal(mVar)
+
+        self._margVar = np.array(mVar, dtype=float)
+        self._stdDev = np.sqrt(self._margVar)
+        self._precision = np.reciprocal(self._margVar)
 
     @property
     def dimension(self):
         return self._precision.size
 
     def apply_chol_factor(self, x):
-        return np.sqrt(np.reciprocal(self._precision)) * x
+        return self._stdDev * x
 
     def apply_inverse(self, x):
         return self._precision * x
 
+    def induced_norm_squared(self, x):
+        return np.square(x) @ self._precision
+
 
 class IIDCovarianceMatrix(DiagonalCovarianceMatrix):
     """
-    Covariance matrix of i.i.d. random variables.
+    Covariance matrix of i.i.d. random variables. Since all marginal
+    variances coincide, the standard deviation and precision are stored as
+    scalars and no arrays of the full dimension are allocated.
     """
 
     def __init__(self, dimension, variance):
 
-        margVar = np.full(dimension, variance)
-        super().__init__(margVar)
+        self._dim = int(dimension)
+        self.variance = variance
+
+    @property
+    def variance(self):
+        return self._variance
+
+    @variance.setter
+    def variance(self, var):
+
+        self._variance = float(var)
+        self._stdDev = np.sqrt(self._variance)
+        self._precision = 1. / self._variance
+
+    @property
+    def marginalVariance(self):
+
+        # read-only, like the marginal variances of diagonal covariances
+        mVar = np.full(self._dim, self._variance)
+        mVar.setflags(write=False)
+
+        return mVar
+
+    @marginalVariance.setter
+    def marginalVariance(self, mVar):
+
+        mVar = np.asarray(mVar, dtype=float)
+
+        if mVar.size != self._dim or np.any(mVar != mVar.flat[0]):
+            raise ValueError("Marginal variances of an IID covariance have to "
+                             "coincide.")
+
+        self.variance = mVar.flat[0]
+
+    @property
+    def dimension(self):
+        return self._dim
+
+    def induced_norm_squared(self, x):
+
+        if np.ndim(x) == 1:
+            return self._precision * np.dot(x, x)
+
+        return self._precision * np.einsum('ij,ij->i', x, x)
 
 
 class DenseCovarianceMatrix(CovarianceMatrix):
+    """
+    Covariance matrix given by its Cholesky factor. If overwrite is set, the
+    factorisation may reuse the memory of denseCovMat, which must not be used
+    afterwards.
+    """
 
-    def __init__(self, denseCovMat):
+    def __init__(self, denseCovMat, overwrite=False):
 
         s = denseCovMat.shape
         assert s[0] == s[1]
 
         self.dim_ = s[0]
 
-        self.cholFactor_ = cholesky(denseCovMat, lower=True)
+        # LAPACK only works in place on Fortran-ordered arrays. The transpose
+        # of a symmetric C-ordered matrix is one, and holds the same values
+        factorInput = denseCovMat.T if overwrite else denseCovMat
+
+        # contrary to cho_factor, cholesky zeroes the upper triangle, such
+        # that the factor can be applied as a dense matrix
+        self.cholFactor_ = cholesky(factorInput, lower=True,
+                                    overwrite_a=overwrite, check_finite=False)
+        self._choFactor = (self.cholFactor_, True)
 
     @property
     def dimension(self):
@@ -86,9 +167,29 @@ class DenseCovarianceMatrix(CovarianceMatrix):
         return self.cholFactor_ @ x
 
     def apply_inverse(self, x):
+        return cho_solve(self._choFactor, x, check_finite=False)
+
+    def induced_norm_squared(self, x):
+        """
+        Computed as the squared Euclidean norm of L^{-1} x, which requires a
+        single triangular solve. The argument checks of solve_triangular
+        dominate its cost in small dimensions, so LAPACK is called directly.
+        """
+
+        y, info = dtrtrs(self.cholFactor_, np.transpose(x), lower=True)
+
+        # same errors as solve_triangular
+        if info > 0:
+            raise LinAlgError("Singular Cholesky factor: diagonal entry "
+                              f"{info - 1} is zero.")
+        if info < 0:
+            raise ValueError(f"Illegal value in argument {-info} of the "
+                             "triangular solve.")
+
+        if np.ndim(x) == 1:
+            return np.dot(y, y)
 
-        y = solve_triangular(self.cholFactor_, x, lower=True)
-        return solve_triangular(self.cholFactor_.T, y, lower=False)
+        return np.einsum('ij,ij->j', y, y)
 
     def dense(self):
-        return np.matmul(self.cholFactor_, self.cholFactor_.T)
+        return self.cholFactor_ @ self.cholFactor_.T
@@ -52,6 +52,104 @@ class WelfordAccumulator():
         # update squared differences
         self._welfordM2 += delta * delta2
 
+    def update_batch(self, realisations, blockSize=1024):
+        """
+        Process the rows of realisations in vectorised blocks. The moments of
+        each block are merged into the running ones with the pairwise update
+        of Chan et al.
+        """
+        realisations = np.asarray(realisations, dtype=float)
+
+        for start in range(0, realisations.shape[0], blockSize):
+
+            block = realisations[start:start + blockSize]
+            blockMean = np.mean(block, axis=0)
+
+            self._merge(block.shape[0], blockMean,
+                        block.shape[0] * np.var(block, axis=0))
+
+    def combine(self, other):
+        """
+        Merge the moments of another accumulator into this one.
+        """
+        if other.nData == 0:
+            return
+
+        self._merge(other.nData, other._mean, other._welfordM2)
+
+    @classmethod
+    def from_array(cls, realisations, blockSize=1024):
+
+        accumulator = cls()
+        accumulator.update_batch(realisations, blockSize)
+
+        return accumulator
+
+    def _merge(self, nOther, otherMean, otherM2):
+
+        if self._mean is None:
+            self._dataSize = nOther
+            self._mean = np.array(otherMean, dtype=float)
+            self._welfordM2 = np.array(otherM2, dtype=float)
+            return
+
+        nTotal = self._dataSize + nOther
+        delta = otherMean - self._mean
+
+        self._mean += delta * (nOther / nTotal)
+        self._welfordM2 += otherM2 \
+            + np.square(delta) * (self._dataSize * nOther / nTotal)
+
+        self._dataSize = nTotal
+
+    def reset(self):
+        self._dataSize = 0
+        self._mean = None
+        self._welfordM2 = None
+
+
+class WelfordCovarianceAccumulator():
+    """
+    Running mean and covariance matrix of vector-valued realisations. Each
+    update costs O(D^2), such that no recomputation over all realisations is
+    required.
+    """
+
+    def __init__(self):
+        self._dataSize = 0
+        self._mean = None
+        self._welfordM2 = None
+
+    def mean(self):
+        return self._mean
+
+    def covariance(self):
+        """
+        unbiased estimate of the covariance matrix
+        """
+        if self._dataSize < 2:
+            raise RuntimeError("Insufficient data for covariance estimation.")
+        return self._welfordM2 / (self._dataSize - 1)
+
+    @property
+    def nData(self):
+        return self._dataSize
+
+    def update(self, realisation):
+
+        if self._mean is None:
+            self._mean = np.zeros(realisation.size)
+            self._welfordM2 = np.zeros((realisation.size, realisation.size))
+
+        delta = realisation - self._mean
+
+        self._dataSize += 1
+        self._mean += delta / self._dataSize
+
+        delta2 = realisation - self._mean
+
+        self._welfordM2 += np.outer(delta, delta2)
+
     def reset(self):
         self._dataSize = 0
         self._mean = None
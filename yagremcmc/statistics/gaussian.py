@@ -58,9 +58,10 @@ class Gaussian(AbsolutelyContinuousParameterLaw):
     def density(self):
         return self._density
 
-    def generate_realisation(self) -> ParameterInterface:
+    def generate_realisation(self, rng=None) -> ParameterInterface:
 
-        xi = standard_normal(self._mean.dimension)
+        xi = standard_normal(self._mean.dimension) if rng is None \
+            else rng.standard_normal(self._mean.dimension)
         colouredXi = self._cov.apply_chol_factor(xi)
 
         return self._mean.clone_with(self._mean.coefficient + colouredXi)
@@ -13,7 +13,11 @@ class DensityInterface(ABC):
 class ParameterLawInterface(ABC):
 
     @abstractmethod
-    def generate_realisation(self) -> ParameterInterface:
+    def generate_realisation(self, rng=None) -> ParameterInterface:
+        """
+        rng is a numpy.random.Generator. If it is not provided, random numbers
+        are drawn from the global state of numpy.random.
+        """
         pass
 
 
@@ -41,4 +45,8 @@ class NoiseModelInterface(ABC):
 
     @abstractmethod
     def induced_norm_squared(self, vector) -> float:
+        """
+        Squared norm induced by the noise covariance. Implementations accept
+        a 2D array as well and return one value per row in this case.
+        """
         pass
@@ -32,11 +32,9 @@ class AdditiveNoiseLikelihood(DensityInterface):
 
     def compute_residual_norm_squared(self, forwardModelEval):
 
-        def norm_squared(x):
-            return self._noiseModel.induced_norm_squared(x)
-
+        # the noise model evaluates all residual rows at once
         residual = self.compute_residual(forwardModelEval)
-        return np.apply_along_axis(norm_squared, 1, residual)
+        return self._noiseModel.induced_norm_squared(residual)
 
     @abstractmethod
     def compute_log_likelihood(self, parameter: ParameterInterface):
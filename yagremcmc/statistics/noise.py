@@ -36,6 +36,10 @@ class AEMNoise(CentredGaussianNoise):
         self._aemNoise = None
         self._useHeuristic = useHeuristic
 
+        # the measurement noise is fixed, only the model error part of the
+        # AEM covariance changes from one update to the next
+        self._dataNoiseMVar = measurementNoise.covariance.marginalVariance
+
     def scaling_heuristic(mVar, eps=1e-6, maxScaling=100):
 
         minVal = max(np.min(mVar), eps)
@@ -49,9 +53,13 @@ class AEMNoise(CentredGaussianNoise):
         noiseScaling = AEMNoise.scaling_heuristic(mVar) \
             if self._useHeuristic else 1.
 
-        aemCov = DiagonalCovarianceMatrix(
-            noiseScaling * mVar + self._dataNoise.covariance.marginalVariance)
-        self._aemNoise = CentredGaussianNoise(aemCov)
+        aemMVar = noiseScaling * mVar + self._dataNoiseMVar
+
+        if self._aemNoise is None:
+            self._aemNoise = CentredGaussianNoise(
+                DiagonalCovarianceMatrix(aemMVar))
+        else:
+            self._aemNoise.covariance.marginalVariance = aemMVar
 
     def induced_norm_squared(self, vector):
 
@@ -1,8 +1,9 @@
 from sys import exit
 
-from numpy import exp, log, square, sqrt, zeros
+from numpy import (arange, array, diag, einsum, errstate, exp, eye, isfinite,
+                   log, pi, square, sqrt, stack, zeros)
 from numpy.random import standard_normal
-from scipy.stats import multivariate_normal
+from scipy.linalg import cho_factor, cho_solve
 from scipy.integrate import solve_ivp
 
 from yagremcmc.parameter.vector import ParameterVector
@@ -21,8 +22,9 @@ class GaussianTargetDensity1d(DensityInterface):
 
     def evaluate_log(self, parameter):
 
-        return -0.5 * square(self.mean_.coefficient -
-                             parameter.coefficient) / self.var_
+        # densities return scalars, also for 1-element coefficient arrays
+        diff = self.mean_.coefficient[0] - parameter.coefficient[0]
+        return -0.5 * diff * diff / self.var_
 
     def evaluate_on_mesh(self, mesh):
 
@@ -33,15 +35,37 @@ class GaussianTargetDensity2d(DensityInterface):
 
     def __init__(self, mean, cov):
 
-        self.dist_ = multivariate_normal(mean.coefficient, cov)
+        self.mean_ = mean.coefficient
+
+        # factorise once. The precision matrix is small, so applying it by a
+        # matrix product is cheaper than a triangular solve per evaluation.
+        choFactor = cho_factor(cov, lower=True)
+        self.precision_ = cho_solve(choFactor, eye(cov.shape[0]))
+
+        logDet = 2. * log(diag(choFactor[0])).sum()
+        self.logNormalisation_ = -0.5 * (cov.shape[0] * log(2. * pi) + logDet)
+
+    def _quadratic_form(self, x):
+        """
+        Squared Mahalanobis distance of the rows of x to the mean.
+        """
+
+        diff = x - self.mean_
+        return einsum('ij,ij->i', diff @ self.precision_, diff)
 
     def evaluate_log(self, parameter):
 
-        return self.dist_.logpdf(parameter.coefficient)
+        diff = parameter.coefficient - self.mean_
+        return self.logNormalisation_ - 0.5 * (diff @ self.precision_ @ diff)
 
     def evaluate_on_mesh(self, mesh):
+        """
+        Density values on a mesh of shape (..., 2), evaluated for all points
+        at once.
+        """
 
-        return self.dist_.pdf(mesh)
+        q = self._quadratic_form(mesh.reshape(-1, 2))
+        return exp(self.logNormalisation_ - 0.5 * q).reshape(mesh.shape[:-1])
 
 
 class LotkaVolterraParameter(ParameterVector):
@@ -58,8 +82,96 @@ class LotkaVolterraParameter(ParameterVector):
         return exp(self.coefficient_)
 
 
+def lotka_volterra_flow(t, x, alpha, beta, gamma, delta):
+    """
+    Right-hand side of the Lotka-Volterra equations. Prey and predator
+    populations are stored in the last axis of x, such that the flow can be
+    evaluated for a whole batch of states at once.
+    """
+
+    prey = x[..., 0]
+    predator = x[..., 1]
+
+    return stack([alpha * prey - beta * prey * predator,
+                  delta * prey * predator - gamma * predator], axis=-1)
+
+
+def lotka_volterra_jacobian(t, x, alpha, beta, gamma, delta):
+    """
+    Jacobian of the Lotka-Volterra flow with respect to the state. Used by
+    implicit integrators, which otherwise approximate it by finite
+    differences.
+    """
+
+    return array([[alpha - beta * x[1], -beta * x[0]],
+                  [delta * x[1], delta * x[0] - gamma]])
+
+
+def lotka_volterra_batch_flow(t, y, alpha, beta, gamma, delta):
+    """
+    Lotka-Volterra flow of a batch of states, which are stacked into the flat
+    vector y = (prey_0, predator_0, prey_1, predator_1, ...).
+    """
+
+    x = y.reshape(-1, 2)
+
+    return lotka_volterra_flow(t, x, alpha, beta, gamma, delta).ravel()
+
+
+def lotka_volterra_batch_jacobian(t, y, alpha, beta, gamma, delta):
+    """
+    Jacobian of the batched flow. The states of the batch do not interact,
+    such that it is block-diagonal with one 2x2 block per state.
+    """
+
+    prey = y[0::2]
+    predator = y[1::2]
+
+    jacobian = zeros((y.size, y.size))
+
+    idx = arange(0, y.size, 2)
+
+    jacobian[idx, idx] = alpha - beta * predator
+    jacobian[idx, idx + 1] = -beta * prey
+    jacobian[idx + 1, idx] = delta * predator
+    jacobian[idx + 1, idx + 1] = delta * prey - gamma
+
+    return jacobian
+
+
+def integrate_rk4(flow, tBoundary, x0, nTimeSteps, args):
+    """
+    Classical Runge-Kutta scheme with fixed step size. All initial values in
+    the batch x0 are integrated simultaneously. Only the states at the final
+    time are returned.
+    """
+
+    t = tBoundary[0]
+    h = (tBoundary[1] - tBoundary[0]) / nTimeSteps
+
+    x = array(x0, dtype=float)
+
+    # blow-ups are detected by the caller
+    with errstate(over='ignore', invalid='ignore'):
+
+        for _ in range(nTimeSteps):
+
+            k1 = flow(t, x, *args)
+            k2 = flow(t + 0.5 * h, x + 0.5 * h * k1, *args)
+            k3 = flow(t + 0.5 * h, x + 0.5 * h * k2, *args)
+            k4 = flow(t + h, x + h * k3, *args)
+
+            x = x + (h / 6.) * (k1 + 2. * k2 + 2. * k3 + k4)
+            t += h
+
+    return x
+
+
 class LotkaVolterraSolver(SolverInterface):
 
+    # integrators of solve_ivp that make use of the Jacobian
+    IMPLICIT_METHODS = ('LSODA', 'BDF', 'Radau')
+
     def __init__(self, design, config):
 
         self.x_ = design
@@ -67,7 +179,28 @@ class LotkaVolterraSolver(SolverInterface):
         self.fixedParam_ = [config['alpha'], config['gamma']]
         self.dataShape_ = (config['nData'], config['dataDim'])
         self._solverMethod = config['solver']
-        self._solverRTol = config['rtol']
+        self._solverRTol = config.get('rtol', 1e-3)
+
+        # the fixed-step RK4 scheme is cheap, but only accurate enough for
+        # surrogate models
+        self._nTimeSteps = config.get('nTimeSteps')
+
+        if self._solverMethod == 'RK4' and self._nTimeSteps is None:
+            raise ValueError("RK4 solver requires the number of time steps.")
+
+        # RK4 blows up close to extinction states, where the problem becomes
+        # stiff. Such evaluations are repeated with an implicit method.
+        self._fallbackMethod = config.get('fallbackSolver')
+
+        self._useJacobian = config.get('jacobian', False)
+
+        # subsequent parameters of a chain are close to each other, so the
+        # initial step size of the last successful solve is a good guess for
+        # the next one. This saves the step size selection of the
+        # integrator, but makes evaluations depend on the previous solve
+        # within the tolerance.
+        self._useFirstStepHint = config.get('firstStepHint', False)
+        self._firstStep = {}
 
         self.param_ = [None, None]
         self.evaluation_ = None
@@ -93,11 +226,6 @@ class LotkaVolterraSolver(SolverInterface):
     def evaluation(self):
         return self.evaluation_
 
-    def flow__(self, t, x, alpha, beta, gamma, delta):
-
-        return [alpha * x[0] - beta * x[0] * x[1],
-                delta * x[0] * x[1] - gamma * x[1]]
-
     def interpolate(self, parameter):
 
         paramEval = parameter.evaluate()
@@ -106,6 +234,43 @@ class LotkaVolterraSolver(SolverInterface):
 
         return
 
+    def _solver_options(self, method):
+
+        options = {}
+
+        # explicit integrators warn about unused Jacobians, even if None
+        if self._useJacobian and method in LotkaVolterraSolver.IMPLICIT_METHODS:
+            options['jac'] = lotka_volterra_batch_jacobian
+
+        if method in self._firstStep:
+            options['first_step'] = self._firstStep[method]
+
+        return options
+
+    def _solve_ivp(self, method, flowParam):
+
+        # all design points are integrated in a single call, sharing one
+        # adaptive time grid
+        odeResult = solve_ivp(
+            lotka_volterra_batch_flow, self.tBoundary_, self.x_.ravel(),
+            method=method, rtol=self._solverRTol, args=flowParam,
+            **self._solver_options(method))
+
+        if (odeResult.status != 0):
+
+            print("forward map evaluation failed. Reason: \n"
+                  + odeResult.message)
+
+            self._firstStep.pop(method, None)
+            self.status_ = EvaluationStatus.FAILURE
+
+            return zeros(self.dataShape_)
+
+        if self._useFirstStepHint and odeResult.t.size > 1:
+            self._firstStep[method] = odeResult.t[1] - odeResult.t[0]
+
+        return odeResult.y[:, -1].reshape(self.dataShape_)
+
     def invoke(self):
 
         self.status_ = EvaluationStatus.SUCCESS
@@ -115,28 +280,27 @@ class LotkaVolterraSolver(SolverInterface):
         gamma = self.fixedParam_[1]
         delta = self.param_[1]
 
-        evaluation = zeros(self.dataShape_)
-
-        def odeFlow(t, x): return self.flow__(t, x, alpha, beta, gamma, delta)
+        flowParam = (alpha, beta, gamma, delta)
 
-        for n in range(self.dataShape_[0]):
+        if self._solverMethod != 'RK4':
+            self.evaluation_ = self._solve_ivp(self._solverMethod, flowParam)
+            return
 
-            odeResult = solve_ivp(
-                odeFlow, self.tBoundary_, self.x_[n, :],
-                method=self._solverMethod, rtol=self._solverRTol)
+        evaluation = integrate_rk4(lotka_volterra_flow, self.tBoundary_,
+                                   self.x_, self._nTimeSteps, flowParam)
 
-            if (odeResult.status != 0):
+        if not isfinite(evaluation).all():
 
-                print("forward map evaluation failed. Reason: \n"
-                      + odeResult.message)
+            if self._fallbackMethod is not None:
+                self.evaluation_ = self._solve_ivp(
+                    self._fallbackMethod, flowParam)
+                return
 
-                self.status_ = EvaluationStatus.FAILURE
+            print("forward map evaluation failed. Reason: \n"
+                  "non-finite RK4 solution")
 
-                self.evaluation_ = zeros(self.dataShape_)
-
-                break
-
-            evaluation[n, :] = odeResult.y[:, -1]
+            self.status_ = EvaluationStatus.FAILURE
+            evaluation = zeros(self.dataShape_)
 
         self.evaluation_ = evaluation
 
@@ -150,8 +314,9 @@ class LotkaVolterraSolver(SolverInterface):
         alpha = self.fixedParam_[0]
         gamma = self.fixedParam_[1]
 
-        def odeFlow(t, x): return self.flow__(t, x, alpha, beta, gamma, delta)
-        odeResult = solve_ivp(odeFlow, self.tBoundary_, y0, method='LSODA')
+        odeResult = solve_ivp(lotka_volterra_flow, self.tBoundary_, y0,
+                              method='LSODA', jac=lotka_volterra_jacobian,
+                              args=(alpha, beta, gamma, delta))
 
         if (odeResult.status != 0):
 
@@ -162,13 +327,16 @@ class LotkaVolterraSolver(SolverInterface):
         return (odeResult.t, odeResult.y)
 
 
-def generate_synthetic_data(parameter, solver, noiseVar):
+def generate_synthetic_data(parameter, solver, noiseVar, rng=None):
 
     sig = sqrt(noiseVar)
 
     solver.interpolate(parameter)
     solver.invoke()
 
-    measurement = solver.evaluation + sig * standard_normal(solver.dataShape)
+    noise = standard_normal(solver.dataShape) if rng is None \
+        else rng.standard_normal(solver.dataShape)
+
+    measurement = solver.evaluation + sig * noise
 
     return Data(measurement)
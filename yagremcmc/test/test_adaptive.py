@@ -4,6 +4,8 @@ import numpy as np
 from numpy.random import seed
 from yagremcmc.parameter.vector import ParameterVector
 from yagremcmc.chain.method.deprecated.am import AMBuilder
+from yagremcmc.chain.method.am import AdaptiveMRWBuilder
+from yagremcmc.statistics.estimation import WelfordCovarianceAccumulator
 from yagremcmc.statistics.covariance import IIDCovarianceMatrix
 from yagremcmc.test.testSetup import GaussianTargetDensity2d
 
@@ -89,3 +91,99 @@ def test_acceptance_rate(setup_am):
 
     assert 0.1 <= acceptanceRate <= 0.8, f"Acceptance rate {acceptanceRate} " \
         "is out of expected range"
+
+
+@pytest.fixture
+def setup_adaptive_mrw():
+
+    tgtMean = ParameterVector(np.array([1., 1.5]))
+    tgtCov = np.array([[3.2, -0.4], [-0.4, 0.2]])
+    tgtDensity = GaussianTargetDensity2d(tgtMean, tgtCov)
+
+    chainBuilder = AdaptiveMRWBuilder()
+    chainBuilder.explicitTarget = tgtDensity
+    chainBuilder.initialCovariance = IIDCovarianceMatrix(2, 0.25)
+    chainBuilder.idleSteps = 100
+    chainBuilder.collectionSteps = 500
+    chainBuilder.adaptionInterval = 20
+
+    return chainBuilder, tgtMean.coefficient, tgtCov
+
+
+def test_welford_covariance():
+
+    samples = np.random.default_rng(3).standard_normal((200, 3))
+
+    accumulator = WelfordCovarianceAccumulator()
+    for x in samples:
+        accumulator.update(x)
+
+    assert accumulator.nData == 200
+    assert np.allclose(accumulator.mean(), np.mean(samples, axis=0))
+    assert np.allclose(accumulator.covariance(),
+                       np.cov(samples, rowvar=False))
+
+
+def test_adaptive_mrw_covariance(setup_adaptive_mrw):
+
+    seed(23)
+
+    chainBuilder, trueMean, trueCov = setup_adaptive_mrw
+    mcmc = chainBuilder.build_method()
+
+    nSteps = 30000
+    initState = ParameterVector(np.array([0., -1.]))
+    mcmc.run(nSteps, initState, verbose=False)
+
+    # the proposal is the scaled chain covariance
+    propCov = mcmc.proposalCovariance.dense()
+    assert np.allclose(propCov / (2.38**2 / 2), trueCov, rtol=0.2, atol=0.05)
+
+    states = np.array(mcmc.chain.trajectory)[chainBuilder.idleSteps:]
+    assert np.allclose(np.mean(states, axis=0), trueMean, atol=0.1)
+
+    acceptanceRate = mcmc.diagnostics.global_acceptance_rate()
+    assert 0.2 <= acceptanceRate <= 0.5
+
+    # a second run starts again from the initial covariance
+    mcmc.run(10, initState, verbose=False)
+    assert mcmc.proposalCovariance is chainBuilder.initialCovariance
+
+
+def test_adaptive_mrw_mixture_and_stop(setup_adaptive_mrw):
+
+    chainBuilder, trueMean, _ = setup_adaptive_mrw
+    chainBuilder.mixtureWeight = 0.05
+    chainBuilder.adaptionStop = 2000
+    chainBuilder.rng = np.random.default_rng(24)
+
+    mcmc = chainBuilder.build_method()
+
+    nSteps = 20000
+    initState = ParameterVector(np.array([0., -1.]))
+    mcmc.run(nSteps, initState, verbose=False)
+
+    # adaption stops once the accumulator holds adaptionStop states
+    adaptiveCov = mcmc._proposalMethod.adaptiveCovariance
+    assert adaptiveCov.isFrozen
+    assert adaptiveCov.accumulator.nData == chainBuilder.adaptionStop
+
+    states = mcmc.chain.trajectory[chainBuilder.idleSteps:]
+    assert np.allclose(np.mean(states, axis=0), trueMean, atol=0.15)
+
+
+def test_adaptive_mrw_builder_validation():
+
+    chainBuilder = AdaptiveMRWBuilder()
+    chainBuilder.explicitTarget = GaussianTargetDensity2d(
+        ParameterVector(np.zeros(2)), np.eye(2))
+    chainBuilder.initialCovariance = IIDCovarianceMatrix(2, 0.25)
+
+    with pytest.raises(ValueError):
+        chainBuilder.build_method()
+
+    chainBuilder.collectionSteps = 500
+    chainBuilder.mixtureWeight = 1.
+
+    with pytest.raises(ValueError):
+        chainBuilder.build_method()
@@ -0,0 +1,82 @@
+import pytest
+import numpy as np
+
+from yagremcmc.postprocessing.autocorrelation import (
+    estimate_autocorrelation_function_1d, estimate_autocorrelation_function_nd,
+    integrated_autocorrelation, mean_and_max_integrated_autocorrelation)
+
+
+@pytest.fixture
+def ar1_sequence():
+
+    rng = np.random.default_rng(5)
+
+    nSteps = 20000
+    phi = np.array([0.9, 0.5])
+
+    seq = np.zeros((nSteps, 2))
+    noise = rng.standard_normal((nSteps, 2))
+
+    for n in range(1, nSteps):
+        seq[n] = phi * seq[n - 1] + noise[n]
+
+    # theoretical integrated autocorrelation times of the components
+    iat = (1. + phi) / (1. - phi)
+
+    return seq, iat
+
+
+def test_acf_matches_direct_correlation(ar1_sequence):
+
+    seq, _ = ar1_sequence
+    x = seq[:500, 0]
+
+    centred = x - np.mean(x)
+    directAcf = np.correlate(centred, centred, mode='full')[x.size - 1:]
+    directAcf /= directAcf[0]
+
+    acf = estimate_autocorrelation_function_1d(list(x))
+
+    assert acf.shape == (500,)
+    assert np.allclose(acf, directAcf)
+
+    # single-component chain trajectories have shape (n, 1)
+    trajectoryAcf = estimate_autocorrelation_function_1d(x[:, np.newaxis])
+
+    assert trajectoryAcf.shape == (500,)
+    assert np.allclose(trajectoryAcf, directAcf)
+
+    with pytest.raises(ValueError):
+        estimate_autocorrelation_function_1d(seq[:500])
+
+
+def test_acf_nd_matches_1d(ar1_sequence):
+
+    seq, _ = ar1_sequence
+
+    acfs = estimate_autocorrelation_function_nd(seq[:1000])
+    reference = np.column_stack(
+        [estimate_autocorrelation_function_1d(seq[:1000, d]) for d in range(2)])
+
+    assert np.allclose(acfs, reference)
+    assert np.allclose(
+        estimate_autocorrelation_function_nd(seq[:1000].T, axis=1), reference.T)
+
+
+def test_integrated_autocorrelation(ar1_sequence):
+
+    seq, iat = ar1_sequence
+
+    assert integrated_autocorrelation(seq, 'max') == \
+        pytest.approx(np.max(iat), rel=0.2)
+
+    with pytest.raises(ValueError):
+        integrated_autocorrelation(seq, 'median')
+
+    assert mean_and_max_integrated_autocorrelation(seq) == (
+        integrated_autocorrelation(seq, 'mean'),
+        integrated_autocorrelation(seq, 'max'))
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from unittest.mock import Mock, create_autospec
 from yagremcmc.chain.method.mrw import MetropolisedRandomWalk, MRWBuilder
 from yagremcmc.chain.method.pcn import PreconditionedCrankNicolson, PCNBuilder
@@ -67,3 +68,36 @@ def test_PCNBuilder_error():
     # Ensure RuntimeError is raised
     with pytest.raises(RuntimeError):
         chainBuilder.build_method()
+
+
+def test_builder_from_prototype():
+
+    mockProposalCov = Mock()
+
+    prototype = MRWBuilder()
+    prototype.proposalCovariance = mockProposalCov
+    prototype.explicitTarget = Mock()
+
+    chainBuilder = MRWBuilder.from_prototype(prototype, bayesModel=Mock(),
+                                             explicitTarget=None)
+
+    # configuration is shared, chain diagnostics are not
+    assert chainBuilder.proposalCovariance is mockProposalCov
+    assert chainBuilder.target_is_posterior()
+    assert prototype.target_is_explicit()
+    assert chainBuilder.diagnostics is not prototype.diagnostics
+    assert type(chainBuilder.diagnostics) is type(prototype.diagnostics)
+
+    # chains built from either builder draw from independent streams
+    prototype.rng = np.random.default_rng(3)
+    chainBuilder = MRWBuilder.from_prototype(prototype)
+
+    assert chainBuilder.rng is not prototype.rng
+    assert isinstance(chainBuilder.rng, np.random.Generator)
+    assert MRWBuilder.from_prototype(prototype, rng=None).rng is None
+
+    with pytest.raises(ValueError):
+        MRWBuilder.from_prototype(prototype, stepSize=0.1)
+
+    with pytest.raises(ValueError):
+        PCNBuilder.from_prototype(prototype)
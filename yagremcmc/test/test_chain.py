@@ -0,0 +1,66 @@
+import pytest
+import numpy as np
+
+from yagremcmc.chain.chain import Chain
+
+
+def test_chain_preallocation():
+
+    chain = Chain()
+    chain.preallocate(3, 2)
+
+    assert chain.length == 0
+    assert chain.trajectory.shape == (0, 2)
+
+    for n in range(5):
+        chain.append(np.array([n, -n]))
+
+    # appending beyond the preallocated length grows the buffer
+    assert chain.length == 5
+    assert np.array_equal(chain.trajectory[:, 0], np.arange(5))
+
+    lastState = chain.trajectory[-1]
+
+    # a fresh buffer does not invalidate previously returned states
+    chain.clear()
+    chain.preallocate(2, 2)
+    chain.append(np.zeros(2))
+
+    assert np.array_equal(lastState, np.array([4., -4.]))
+    assert chain.length == 1
+
+    # a buffer without capacity grows as well
+    chain.clear()
+    chain.preallocate(0, 2)
+    chain.append(np.ones(2))
+
+    assert np.array_equal(chain.trajectory, np.ones((1, 2)))
+
+
+def test_chain_thinning():
+
+    chain = Chain()
+    chain.burnIn = 3
+    chain.thinning = 4
+
+    nSteps = 20
+    assert chain.n_recorded(nSteps) == 5
+
+    chain.preallocate(chain.n_recorded(nSteps), 1)
+
+    for n in range(nSteps):
+        chain.append(np.array([n]))
+
+    assert np.array_equal(chain.trajectory[:, 0], np.arange(3, nSteps, 4))
+
+    # settings survive clearing the chain
+    chain.clear()
+    assert chain.thinning == 4 and chain.burnIn == 3
+    assert chain.n_recorded(2) == 0
+
+    with pytest.raises(ValueError):
+        chain.thinning = 0
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,96 @@
+import pickle
+import pytest
+import numpy as np
+
+from yagremcmc.statistics.covariance import (DiagonalCovarianceMatrix,
+                                             IIDCovarianceMatrix,
+                                             DenseCovarianceMatrix)
+
+
+denseCov = np.array([[2., 0.3, 0.1], [0.3, 1., 0.2], [0.1, 0.2, 0.5]])
+
+covariances = [
+    (DiagonalCovarianceMatrix(np.array([1., 2., 3.])), np.diag([1., 2., 3.])),
+    (IIDCovarianceMatrix(3, 0.4), 0.4 * np.eye(3)),
+    (DenseCovarianceMatrix(denseCov), denseCov)]
+
+
+@pytest.mark.parametrize("cov, matrix", covariances)
+def test_induced_norm_squared(cov, matrix):
+
+    x = np.random.default_rng(0).standard_normal((5, 3))
+    precision = np.linalg.inv(matrix)
+
+    refNorms = np.einsum('ij,jk,ik->i', x, precision, x)
+
+    # rows of a 2D array are evaluated at once
+    assert np.allclose(cov.induced_norm_squared(x), refNorms)
+    assert np.isclose(cov.induced_norm_squared(x[0]), refNorms[0])
+
+
+@pytest.mark.parametrize("cov, matrix", covariances)
+def test_covariance_pickling(cov, matrix):
+
+    # covariances are sent to worker processes with their chain builders
+    restored = pickle.loads(pickle.dumps(cov))
+
+    x = np.array([0.5, -1., 2.])
+    assert np.isclose(restored.induced_norm_squared(x),
+                      x @ np.linalg.solve(matrix, x))
+
+
+
+@pytest.mark.parametrize("cov", [DiagonalCovarianceMatrix(np.array([1., 2.])),
+                                 IIDCovarianceMatrix(2, 0.4)])
+def test_marginal_variance_read_only(cov):
+
+    # in-place changes would bypass the cached standard deviations
+    with pytest.raises(ValueError):
+        cov.marginalVariance *= 2.
+
+    mVar = 2. * cov.marginalVariance
+    cov.marginalVariance = mVar
+
+    assert np.allclose(cov.apply_chol_factor(np.ones(2)), np.sqrt(mVar))
+    assert np.allclose(cov.apply_inverse(np.ones(2)), 1. / mVar)
+
+
+def test_dense_norm_singular_factor():
+
+    cov = DenseCovarianceMatrix(denseCov)
+    cov.cholFactor_[1, 1] = 0.
+
+    with pytest.raises(np.linalg.LinAlgError):
+        cov.induced_norm_squared(np.ones(3))
+
+
+def test_iid_covariance():
+
+    cov = IIDCovarianceMatrix(4, 0.25)
+    x = np.array([1., -2., 0.5, 3.])
+
+    assert cov.dimension == 4
+    assert np.allclose(cov.marginalVariance, np.full(4, 0.25))
+    assert np.allclose(cov.apply_chol_factor(x), 0.5 * x)
+    assert np.allclose(cov.apply_inverse(x), 4. * x)
+
+    cov.marginalVariance = np.full(4, 0.5)
+    assert cov.variance == 0.5
+
+    with pytest.raises(ValueError):
+        cov.marginalVariance = np.array([0.5, 0.5, 0.5, 1.])
+
+
+
+def test_dense_covariance_overwrite():
+
+    # the factorisation may consume the matrix it is given
+    covMatrix = np.copy(denseCov)
+    cov = DenseCovarianceMatrix(covMatrix, overwrite=True)
+
+    assert np.allclose(cov.dense(), denseCov)
+    assert np.allclose(np.triu(cov.cholFactor_, 1), 0.)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -2,7 +2,6 @@ import pytest
 import numpy as np
 
 from yagremcmc.chain.transition import TransitionData
-from yagremcmc.parameter.scalar import ScalarParameter
 from yagremcmc.chain.diagnostics import AcceptanceRateDiagnostics
 from yagremcmc.statistics.estimation import WelfordAccumulator
 
@@ -26,7 +25,31 @@ def test_acceptance_rate_diagnostics(testLag):
     assert np.isclose(diagnostics.global_acceptance_rate(), expectedRate)
 
     diagnostics.reset()
-    assert diagnostics._decisions == []
+    assert diagnostics.nDecisions == 0
+
+
+def test_record_outcome():
+
+    outcomes = np.random.default_rng(4).integers(0, 2, 3000)
+
+    diagnostics = AcceptanceRateDiagnostics()
+    diagnostics.lag = 500
+
+    for outcome in outcomes:
+        diagnostics.record_outcome(int(outcome))
+
+    assert diagnostics.nDecisions == outcomes.size
+    assert np.isclose(diagnostics.global_acceptance_rate(), np.mean(outcomes))
+    assert np.isclose(diagnostics.rolling_acceptance_rate(),
+                      np.mean(outcomes[-500:]))
+
+    # shrinking the lag keeps the most recent decisions
+    diagnostics.lag = 100
+    assert np.isclose(diagnostics.rolling_acceptance_rate(),
+                      np.mean(outcomes[-100:]))
+
+    with pytest.raises(ValueError):
+        diagnostics.record_outcome(2)
 
 
 @pytest.mark.parametrize("paramDim",
@@ -39,16 +62,8 @@ def test_moment_diagnostics(paramDim):
     """
     Test WelfordAccumulator against NumPy implementations of mean and variance.
     """
-    accumulator = WelfordAccumulator()
-
-    stateVectors = [np.random.randn(paramDim[1]) for _ in range(paramDim[0])]
-
-    for vector in stateVectors:
-        transitionData = TransitionData(
-            state=None,
-            proposal=ScalarParameter(vector),
-            outcome=TransitionData.ACCEPTED)
-        accumulator.update(transitionData.proposal.coefficient)
+    stateVectors = np.random.randn(*paramDim)
+    accumulator = WelfordAccumulator.from_array(stateVectors)
 
     computedMean = accumulator.mean()
     computedVar = accumulator.marginal_variance()
@@ -66,5 +81,41 @@ def test_moment_diagnostics(paramDim):
     accumulator.reset()
 
 
+
+def test_welford_batch_update():
+    """
+    Mixing single and batched updates yields the moments of all realisations.
+    """
+    realisations = np.random.default_rng(5).standard_normal((500, 4))
+
+    singleAccumulator = WelfordAccumulator()
+    for x in realisations:
+        singleAccumulator.update(x)
+
+    batchAccumulator = WelfordAccumulator()
+    batchAccumulator.update(realisations[0])
+    batchAccumulator.update_batch(realisations[1:200])
+    batchAccumulator.update_batch(realisations[200:], blockSize=64)
+
+    assert batchAccumulator.nData == singleAccumulator.nData
+    assert np.allclose(batchAccumulator.mean(), singleAccumulator.mean())
+    assert np.allclose(batchAccumulator.marginal_variance(),
+                       singleAccumulator.marginal_variance())
+
+
+def test_welford_combine():
+
+    realisations = np.random.default_rng(6).standard_normal((300, 3))
+
+    accumulator = WelfordAccumulator.from_array(realisations[:100])
+    accumulator.combine(WelfordAccumulator.from_array(realisations[100:]))
+    accumulator.combine(WelfordAccumulator())
+
+    assert accumulator.nData == 300
+    assert np.allclose(accumulator.mean(), np.mean(realisations, axis=0))
+    assert np.allclose(accumulator.marginal_variance(),
+                       np.var(realisations, axis=0, ddof=1))
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -3,8 +3,9 @@ import pytest
 
 from yagremcmc.statistics.data import Data
 from yagremcmc.statistics.likelihood import AdditiveGaussianNoiseLikelihood
-from yagremcmc.statistics.noise import CentredGaussianNoise
-from yagremcmc.statistics.covariance import CovarianceMatrix
+from yagremcmc.statistics.noise import CentredGaussianNoise, AEMNoise
+from yagremcmc.statistics.covariance import (CovarianceMatrix,
+                                             DiagonalCovarianceMatrix)
 from yagremcmc.parameter.vector import ParameterVector
 from yagremcmc.utility.memoisation import EvaluationCache
 
@@ -159,3 +160,28 @@ def test_stress_test_memoisation(mock_noise, mock_forward_model):
 
     cacheTOL = 1e-3
     assert cacheHits <= 2. * (1. + cacheTOL) * numTests
+
+
+def test_aem_noise_update():
+
+    dataNoise = CentredGaussianNoise(
+        DiagonalCovarianceMatrix(np.array([0.1, 0.2])))
+    aemNoise = AEMNoise(dataNoise, useHeuristic=False)
+
+    x = np.array([[1., -2.], [0.5, 3.]])
+
+    assert np.allclose(aemNoise.induced_norm_squared(x),
+                       dataNoise.induced_norm_squared(x))
+
+    for mVar in [np.array([1., 0.5]), np.array([0.3, 0.7])]:
+
+        aemNoise.set_error_marginal_variance(mVar)
+
+        refNoise = CentredGaussianNoise(
+            DiagonalCovarianceMatrix(mVar + np.array([0.1, 0.2])))
+
+        assert np.allclose(aemNoise.induced_norm_squared(x),
+                           refNoise.induced_norm_squared(x))
+
+    # the measurement noise itself is not modified by the updates
+    assert np.allclose(dataNoise.covariance.marginalVariance, [0.1, 0.2])
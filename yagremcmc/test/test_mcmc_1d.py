@@ -7,6 +7,7 @@ from yagremcmc.test.testSetup import GaussianTargetDensity1d
 from yagremcmc.statistics.covariance import IIDCovarianceMatrix
 from yagremcmc.chain.method.mrw import MetropolisedRandomWalk
 from yagremcmc.chain.diagnostics import *
+from yagremcmc.chain.transition import TransitionData
 from yagremcmc.parameter.scalar import ScalarParameter
 from yagremcmc.postprocessing.autocorrelation import integrated_autocorrelation
 
@@ -28,7 +29,7 @@ def test_metropolishastings_initialisation(Diagnostics):
     mc = MetropolisedRandomWalk(tgtDensity, proposalCov, diagnostics)
 
     assert isinstance(mc.target, type(tgtDensity))
-    assert mc.chain.trajectory == []
+    assert mc.chain.length == 0
 
 
 @pytest.mark.parametrize("Diagnostics",
@@ -43,17 +44,53 @@ def test_accept_reject(Diagnostics):
     proposalVariance = 0.5
     proposalCov = IIDCovarianceMatrix(1, proposalVariance)
 
-    diagnostics = Diagnostics()
-
-    mc = MetropolisedRandomWalk(tgtDensity, proposalCov, diagnostics)
+    def fresh_chain():
+        return MetropolisedRandomWalk(tgtDensity, proposalCov, Diagnostics())
 
     state = ScalarParameter.from_value(np.array([2.]))
     proposal = ScalarParameter.from_value(np.array([2.5]))
 
-    transitionOutcome = mc._accept_reject(proposal, state)
+    transitionOutcome = fresh_chain()._accept_reject(proposal, state)
 
     assert transitionOutcome.state in [proposal, state]
 
+    # moves towards the mode are accepted with certainty
+    assert fresh_chain()._acceptance_probability(state, proposal) == 1.
+    assert fresh_chain()._accept_reject(state, proposal).outcome == \
+        TransitionData.ACCEPTED
+    assert np.isclose(fresh_chain()._acceptance_probability(proposal, state),
+                      np.exp(-0.5 * (2.5**2 - 2.**2)))
+
+    # a different state on the same chain requires its own log density, not
+    # the one cached for the previous state
+    mc = fresh_chain()
+    mode = ScalarParameter.from_value(np.array([0.]))
+
+    assert np.isclose(mc._acceptance_probability(proposal, state),
+                      np.exp(-0.5 * (2.5**2 - 2.**2)))
+    assert np.isclose(mc._acceptance_probability(proposal, mode),
+                      np.exp(-0.5 * 2.5**2))
+
+
+def test_cached_state_density():
+
+    tgtMean = ScalarParameter.from_coefficient(np.array([0.]))
+    tgtDensity = GaussianTargetDensity1d(tgtMean, 1.)
+
+    proposalCov = IIDCovarianceMatrix(1, 0.5)
+
+    mc = MetropolisedRandomWalk(tgtDensity, proposalCov, DummyDiagnostics())
+
+    proposal = ScalarParameter.from_value(np.array([2.5]))
+
+    # the cached log density of one state must not be used for another
+    for stateValue in [2., 0.]:
+
+        state = ScalarParameter.from_value(np.array([stateValue]))
+
+        assert np.isclose(mc._acceptance_probability(proposal, state),
+                          np.exp(-0.5 * (2.5**2 - stateValue**2)))
+
 
 @pytest.mark.parametrize("Diagnostics",
                          [DummyDiagnostics, AcceptanceRateDiagnostics,
@@ -82,7 +119,7 @@ def test_run_chain(Diagnostics):
 
     mc = MetropolisedRandomWalk(tgtDensity, proposalCov, diagnostics)
 
-    nSteps = 15000
+    nSteps = 40000
     initState = ScalarParameter.from_coefficient(np.array([-3.]))
     mc.run(nSteps, initState, verbose=False)
 
@@ -3,8 +3,8 @@ import numpy as np
 
 from numpy.random import seed
 from yagremcmc.test.testSetup import GaussianTargetDensity2d
-from yagremcmc.statistics.covariance import IIDCovarianceMatrix, DiagonalCovarianceMatrix
-from yagremcmc.chain.method.mrw import MetropolisedRandomWalk
+from yagremcmc.statistics.covariance import IIDCovarianceMatrix, DiagonalCovarianceMatrix, DenseCovarianceMatrix
+from yagremcmc.chain.method.mrw import MetropolisedRandomWalk, MRWProposal
 from yagremcmc.chain.diagnostics import *
 from yagremcmc.parameter.vector import ParameterVector
 
@@ -81,5 +81,101 @@ def test_moments(mcmcProposal, Diagnostics):
         "mcmcProposal='{mcmcProposal}'"
 
 
+def test_generator_reproducibility():
+
+    tgtMean = ParameterVector.from_coefficient(np.array([1., 1.5]))
+    tgtDensity = GaussianTargetDensity2d(tgtMean, np.eye(2))
+    proposalCov = IIDCovarianceMatrix(tgtMean.dimension, 0.5)
+
+    initState = ParameterVector.from_coefficient(np.array([-2., 0.]))
+
+    def run_chain(seed):
+
+        mcmc = MetropolisedRandomWalk(tgtDensity, proposalCov,
+                                      AcceptanceRateDiagnostics(),
+                                      np.random.default_rng(seed))
+        mcmc.run(500, initState, verbose=False)
+
+        return np.array(mcmc.chain.trajectory)
+
+    assert np.array_equal(run_chain(3), run_chain(3))
+    assert not np.array_equal(run_chain(3), run_chain(4))
+
+
+def test_state_log_density_cached():
+
+    tgtMean = ParameterVector.from_coefficient(np.array([1., 1.5]))
+    tgtDensity = GaussianTargetDensity2d(tgtMean, np.eye(2))
+
+    nEvaluations = 0
+    evaluate_log = tgtDensity.evaluate_log
+
+    def counting_evaluate_log(parameter):
+
+        nonlocal nEvaluations
+        nEvaluations += 1
+
+        return evaluate_log(parameter)
+
+    tgtDensity.evaluate_log = counting_evaluate_log
+
+    mcmc = MetropolisedRandomWalk(tgtDensity, IIDCovarianceMatrix(2, 0.5),
+                                  AcceptanceRateDiagnostics(),
+                                  np.random.default_rng(8))
+
+    nSteps = 400
+    mcmc.run(nSteps, ParameterVector(np.array([-2., 0.])), verbose=False)
+
+    # one evaluation of the initial state, one per proposal
+    assert nEvaluations == nSteps
+
+
+def test_dense_proposal():
+
+    covMatrix = np.array([[1.2, -0.2], [-0.2, 0.4]])
+    proposalCov = DenseCovarianceMatrix(covMatrix)
+
+    proposal = MRWProposal(proposalCov, np.random.default_rng(5))
+    proposal.set_state(ParameterVector(np.array([1., -1.])))
+
+    # white noise is drawn in blocks and consumed row by row
+    xi = np.random.default_rng(5).standard_normal((3, 2))
+    expected = np.array([1., -1.]) + xi @ np.linalg.cholesky(covMatrix).T
+
+    for k in range(3):
+        assert np.allclose(proposal.generate_proposal().coefficient,
+                           expected[k])
+
+
+def test_iid_proposal():
+
+    proposal = MRWProposal(IIDCovarianceMatrix(2, 0.25),
+                           np.random.default_rng(6))
+    proposal.set_state(ParameterVector(np.array([1., -1.])))
+
+    xi = np.random.default_rng(6).standard_normal(2)
+    expected = np.array([1., -1.]) + 0.5 * xi
+
+    assert np.allclose(proposal.generate_proposal().coefficient, expected)
+
+
+def test_target_density_on_mesh():
+
+    from scipy.stats import multivariate_normal
+
+    mean = np.array([1., 1.5])
+    cov = np.array([[1.2, -0.2], [-0.2, 0.4]])
+    tgtDensity = GaussianTargetDensity2d(ParameterVector(mean), cov)
+
+    X, Y = np.meshgrid(np.linspace(-2., 4., 30), np.linspace(-1., 3., 20))
+    mesh = np.dstack((X, Y))
+
+    reference = multivariate_normal(mean, cov)
+
+    assert np.allclose(tgtDensity.evaluate_on_mesh(mesh), reference.pdf(mesh))
+    assert np.isclose(tgtDensity.evaluate_log(ParameterVector(mesh[3, 7])),
+                      reference.logpdf(mesh[3, 7]))
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -254,3 +254,22 @@ def test_mlda_five_level_method(setup_mlda_test_data):
         meanEst, data["tgtMean"], atol=0.2,
         err_msg="Estimated mean from five-level method deviates significantly from target mean."
     )
+
+
+def test_mlda_generator_reproducibility(mlda_chain_builder):
+
+    initState = ParameterVector(np.array([-2.0, 1.0]))
+    trajectories = []
+
+    for globalSeed in (1, 2):
+
+        # the chain must not depend on the global state of numpy.random
+        np.random.seed(globalSeed)
+
+        mlda_chain_builder.rng = np.random.default_rng(17)
+        mcmc = mlda_chain_builder.build_method()
+        mcmc.run(300, initState, verbose=False)
+
+        trajectories.append(mcmc.chain.trajectory)
+
+    assert np.array_equal(trajectories[0], trajectories[1])
@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+
+from yagremcmc.test.testSetup import GaussianTargetDensity2d
+from yagremcmc.statistics.covariance import IIDCovarianceMatrix
+from yagremcmc.chain.method.mrw import MRWBuilder
+from yagremcmc.chain.parallel import run_chains_parallel
+from yagremcmc.parameter.vector import ParameterVector
+
+
+@pytest.fixture
+def mrw_builder():
+
+    tgtMean = ParameterVector(np.array([1., 1.5]))
+    tgtCov = np.array([[1.2, -0.2], [-0.2, 0.4]])
+
+    chainBuilder = MRWBuilder()
+    chainBuilder.explicitTarget = GaussianTargetDensity2d(tgtMean, tgtCov)
+    chainBuilder.proposalCovariance = IIDCovarianceMatrix(2, 0.25)
+
+    return chainBuilder
+
+
+def test_run_chains_parallel(mrw_builder):
+
+    nChains = 3
+    nSteps = 4000
+    initState = ParameterVector(np.array([-2., 0.]))
+
+    trajectories, diagnostics = run_chains_parallel(
+        mrw_builder, nChains, nSteps, initState, seed=31)
+
+    assert trajectories.shape == (nChains, nSteps, 2)
+    assert len(diagnostics) == nChains
+
+    # chains start at the same state, but use independent random streams
+    assert np.all(trajectories[:, 0] == initState.coefficient)
+    assert not np.array_equal(trajectories[0], trajectories[1])
+
+    for dgnstc in diagnostics:
+        assert 0.1 < dgnstc.global_acceptance_rate() < 0.9
+
+    burnin = 200
+    pooledMean = np.mean(trajectories[:, burnin:].reshape(-1, 2), axis=0)
+    assert np.allclose(pooledMean, np.array([1., 1.5]), atol=0.1)
+
+
+def test_run_chains_parallel_reproducible(mrw_builder):
+
+    nSteps = 200
+    initStates = [ParameterVector(np.array([-2., 0.])),
+                  ParameterVector(np.array([2., 1.]))]
+
+    first, _ = run_chains_parallel(mrw_builder, 2, nSteps, initStates, seed=7)
+    second, _ = run_chains_parallel(mrw_builder, 2, nSteps, initStates, seed=7)
+
+    assert np.array_equal(first, second)
+
+    with pytest.raises(ValueError):
+        run_chains_parallel(mrw_builder, 3, nSteps, initStates, seed=7)
+
+
+if __name__ == "__main__":
+    pytest.main()
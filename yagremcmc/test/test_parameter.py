@@ -0,0 +1,44 @@
+import pytest
+import numpy as np
+
+from yagremcmc.parameter.vector import ParameterVector
+
+
+def test_parameter_vector_read_only():
+
+    coefficient = np.array([1., 2.])
+    parameter = ParameterVector(coefficient)
+
+    with pytest.raises(ValueError):
+        parameter.coefficient[0] = 0.
+
+    # the caller's array is not affected
+    assert coefficient.flags.writeable
+
+    # and changing it does not change the parameter
+    coefficient[0] = 9.
+    assert np.array_equal(parameter.coefficient, np.array([1., 2.]))
+
+    # read-only coefficients are shared without a copy
+    assert np.shares_memory(ParameterVector(parameter.coefficient).coefficient,
+                            parameter.coefficient)
+
+    assert parameter == ParameterVector(np.array([1., 2.]))
+    assert parameter.clone_with(parameter.coefficient + 1.) \
+        == ParameterVector(np.array([2., 3.]))
+
+
+
+def test_parameter_vector_slots():
+
+    parameter = ParameterVector(np.array([1., 2.]))
+
+    assert not hasattr(parameter, '__dict__')
+    assert parameter.coefficient_type is np.ndarray
+
+    with pytest.raises(AttributeError):
+        parameter.someAttribute = 1.
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -94,6 +94,119 @@ def test_invoke():
                                rtol=1e-3, atol=1e-6)
 
 
+def test_invoke_rk4():
+
+    rk4Config = dict(config, solver='RK4', nTimeSteps=200)
+
+    solver = LotkaVolterraSolver(design, rk4Config)
+    solver.interpolate(parameter)
+    solver.invoke()
+
+    assert solver.status == EvaluationStatus.SUCCESS
+    assert solver.evaluation_.shape == (config['nData'], config['dataDim'])
+
+    beta = np.exp(coefficients[0])
+    delta = np.exp(coefficients[1])
+
+    ref_result = reference_lotka_volterra_solver(
+        config['alpha'], beta, config['gamma'], delta, design[0],
+        (0, config['T']))
+
+    # the fixed-step scheme is meant for surrogate models only, validate it
+    # against the adaptive reference with a correspondingly looser tolerance
+    np.testing.assert_allclose(solver.evaluation_, ref_result,
+                               rtol=1e-3, atol=1e-6)
+
+    with pytest.raises(ValueError):
+        LotkaVolterraSolver(design, dict(config, solver='RK4'))
+
+
+def test_invoke_rk4_fallback():
+
+    # close to extinction, the problem is stiff and the coarse RK4 scheme
+    # diverges
+    stiffParameter = LotkaVolterraParameter.from_coefficient(
+        np.array([-7., 2.8]))
+    stiffConfig = dict(config, alpha=0.8, gamma=0.4, solver='RK4',
+                       nTimeSteps=50, rtol=1e-6)
+
+    solver = LotkaVolterraSolver(design, stiffConfig)
+    solver.interpolate(stiffParameter)
+    solver.invoke()
+
+    assert solver.status == EvaluationStatus.FAILURE
+
+    fallbackConfig = dict(stiffConfig, fallbackSolver='LSODA', jacobian=True)
+
+    solver = LotkaVolterraSolver(design, fallbackConfig)
+    solver.interpolate(stiffParameter)
+    solver.invoke()
+
+    assert solver.status == EvaluationStatus.SUCCESS
+
+    beta, delta = np.exp(stiffParameter.coefficient)
+    refResult = solve_ivp(
+        lambda t, y: [0.8 * y[0] - beta * y[0] * y[1],
+                      delta * y[0] * y[1] - 0.4 * y[1]],
+        (0, config['T']), design[0], method='DOP853', rtol=1e-10,
+        atol=1e-10).y[:, -1]
+
+    np.testing.assert_allclose(solver.evaluation_[0], refResult, rtol=1e-4,
+                               atol=1e-6)
+
+
+def test_invoke_batch():
+
+    # several design points are integrated jointly in a single solve
+    batchDesign = np.array([[1., 0.8], [0.5, 1.2], [1.4, 0.6]])
+
+    for method in ('LSODA', 'DOP853', 'BDF'):
+
+        batchConfig = dict(config, nData=3, solver=method, jacobian=True)
+
+        solver = LotkaVolterraSolver(batchDesign, batchConfig)
+        solver.interpolate(parameter)
+        solver.invoke()
+
+        assert solver.status == EvaluationStatus.SUCCESS
+        assert solver.evaluation_.shape == (3, config['dataDim'])
+
+        beta, delta = np.exp(coefficients)
+
+        for n in range(3):
+
+            refResult = reference_lotka_volterra_solver(
+                config['alpha'], beta, config['gamma'], delta,
+                batchDesign[n], (0, config['T']))
+
+            np.testing.assert_allclose(solver.evaluation_[n], refResult[0],
+                                       rtol=1e-3, atol=1e-6)
+
+
+def test_invoke_first_step_hint():
+
+    hintConfig = dict(config, firstStepHint=True)
+
+    solver = LotkaVolterraSolver(design, hintConfig)
+    beta, delta = np.exp(coefficients)
+
+    refResult = reference_lotka_volterra_solver(
+        config['alpha'], beta, config['gamma'], delta, design[0],
+        (0, config['T']))
+
+    # the second solve starts with the initial step size of the first one
+    for _ in range(2):
+
+        solver.interpolate(parameter)
+        solver.invoke()
+
+        assert solver.status == EvaluationStatus.SUCCESS
+        np.testing.assert_allclose(solver.evaluation_, refResult,
+                                   rtol=1e-3, atol=1e-6)
+
+    assert solver._solver_options('LSODA')['first_step'] > 0.
+
+
 def test_full_solution():
 
     solver = LotkaVolterraSolver(design, config)
@@ -1,7 +1,11 @@
 import pytest
 
 from numpy import array
-from yagremcmc.utility.memoisation import EvaluationCache
+from yagremcmc.utility.memoisation import (EvaluationCache, ForwardModelCache,
+                                           AEMCache)
+from yagremcmc.model.evaluation import EvaluationStatus, AEMEvaluation
+from yagremcmc.model.forwardModel import ForwardModel
+from yagremcmc.parameter.vector import ParameterVector
 
 
 class MockParameterInterface:
@@ -72,5 +76,93 @@ def test_cache_call(cache):
     assert cache(param1) == "mockValue"
 
 
+class CountingSolver:
+
+    def __init__(self):
+        self.nInvocations = 0
+        self._param = None
+
+    @property
+    def status(self):
+        return EvaluationStatus.SUCCESS
+
+    @property
+    def evaluation(self):
+        return 2. * self._param.coefficient
+
+    def interpolate(self, parameter):
+        self._param = parameter
+
+    def invoke(self):
+        self.nInvocations += 1
+
+
+def test_forward_model_cache_lru():
+
+    cache = ForwardModelCache(2)
+
+    param1 = ParameterVector(array([1., 2.]))
+    param2 = ParameterVector(array([3., 4.]))
+    param3 = ParameterVector(array([5., 6.]))
+
+    cache.add(param1, array([0.1]))
+    cache.add(param2, array([0.2]))
+
+    # retrieving param1 makes param2 the least recently used entry
+    assert cache.retrieve(ParameterVector(array([1., 2.])))[0] == 0.1
+    cache.add(param3, array([0.3]))
+
+    assert cache.contains(param1)
+    assert not cache.contains(param2)
+    assert cache.contains(param3)
+    assert cache.size == 2
+
+    assert cache.hits == 1
+    assert cache.misses == 3
+
+    with pytest.raises(ValueError):
+        cache.retrieve(param1)[0] = 1.
+
+    cache.clear()
+    assert cache.size == 0
+    assert not cache.contains(param1)
+
+
+def test_forward_model_memoisation():
+
+    solver = CountingSolver()
+    fwdModel = ForwardModel(solver, cacheSize=3)
+
+    for _ in range(4):
+        evaluation = fwdModel.evaluate(ParameterVector(array([1., -1.])))
+
+    assert solver.nInvocations == 1
+    assert fwdModel.evaluationCache.hits == 3
+    assert all(evaluation == array([2., -2.]))
+
+    fwdModel.clear_cache()
+    fwdModel.evaluate(ParameterVector(array([1., -1.])))
+    assert solver.nInvocations == 2
+
+    uncachedModel = ForwardModel(CountingSolver())
+    assert uncachedModel.evaluationCache is None
+
+
+def test_aem_cache_copies_evaluation():
+
+    cache = AEMCache()
+    param = ParameterVector(array([1., 2.]))
+
+    # solvers may overwrite their evaluation buffer in the next invocation
+    buffer = array([0.5, -0.5])
+    cache.add(param, AEMEvaluation(buffer, -1.2))
+    buffer[:] = 0.
+
+    fmEval, logL = cache.retrieve(param)
+
+    assert all(fmEval == array([0.5, -0.5]))
+    assert logL == -1.2
+
+
 if __name__ == '__main__':
     pytest.main()
@@ -1,4 +1,7 @@
+import numpy as np
+
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from yagremcmc.parameter.interface import ParameterInterface
 from yagremcmc.model.evaluation import AEMEvaluation
 
@@ -73,6 +76,79 @@ class EvaluationCache(Cache):
         raise RuntimeError("Evaluation Cache missed.")
 
 
+class ForwardModelCache(Cache):
+    """
+    Least-recently-used cache for forward model evaluations. Parameters are
+    keyed by the raw bytes of their coefficient, such that a lookup is a
+    dictionary access rather than a linear search over stored parameters.
+    """
+
+    def __init__(self, cacheSize: int) -> None:
+
+        if cacheSize < 1:
+            raise ValueError("Forward model cache needs to hold at least one "
+                             "evaluation.")
+
+        super().__init__(cacheSize)
+        self._cache = OrderedDict()
+
+    @property
+    def size(self):
+        return len(self._cache)
+
+    @staticmethod
+    def _key(parameter: ParameterInterface):
+        return parameter.coefficient.tobytes()
+
+    def contains(self, parameter: ParameterInterface) -> bool:
+        return ForwardModelCache._key(parameter) in self._cache
+
+    def add(self, parameter: ParameterInterface, cacheValue) -> None:
+        """
+        Store a read-only copy of the evaluation, so that later modifications
+        of the solver output do not alter cached values. Each insertion
+        corresponds to an evaluation that had to be computed, and is counted
+        as a miss. Returns the stored copy.
+        """
+
+        key = ForwardModelCache._key(parameter)
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        self._misses += 1
+
+        if len(self._cache) >= self._maxSize:
+            self._cache.popitem(last=False)
+
+        value = np.array(cacheValue)
+        value.flags.writeable = False
+
+        self._cache[key] = value
+
+        return value
+
+    def retrieve(self, parameter: ParameterInterface):
+
+        key = ForwardModelCache._key(parameter)
+
+        if key in self._cache:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        self._misses += 1
+        raise RuntimeError("Forward model cache missed.")
+
+    def clear(self) -> None:
+
+        self._cache.clear()
+
+        self._hits = 0
+        self._misses = 0
+
+
 class AEMCache(Cache):
     """
     Cache specifically designed to store AEM-relevant evaluations.
@@ -112,8 +188,9 @@ class AEMCache(Cache):
         if len(self._keys) >= self._maxSize:
             self._evict_oldest()
 
+        # solvers may reuse their evaluation buffer, so store a copy
         self._keys.append(parameter)
-        self._fmCache.append(cacheValue.forwardModelEvaluation)
+        self._fmCache.append(np.copy(cacheValue.forwardModelEvaluation))
         self._llCache.append(cacheValue.logLikelihoodEvaluation)
 
     def retrieve(self, parameter: ParameterInterface):